@@ -84,6 +84,9 @@ from .pdt_msg_strings import (
     PDT_DES_FILLETSEG,
     PDT_DES_FILLETVERTS,
     PDT_DES_FILLINT,
+    PDT_DES_INTPLANAR,
+    PDT_DES_INTINCREMENTAL,
+    PDT_DES_SCRIPT,
     PDT_DES_FLIPANG,
     PDT_DES_FLIPPER,
     PDT_DES_LIBCOLS,
@@ -99,8 +102,10 @@ from .pdt_msg_strings import (
     PDT_DES_OPMODE,
     PDT_DES_OUTPUT,
     PDT_DES_PIVOTDIS,
+    PDT_DES_PPCOUNT,
     PDT_DES_PPLOC,
     PDT_DES_PPSCALEFAC,
+    PDT_DES_PPSCALEVIEW,
     PDT_DES_PPSIZE,
     PDT_DES_PPTRANS,
     PDT_DES_PPWIDTH,
@@ -109,6 +114,7 @@ from .pdt_msg_strings import (
     PDT_DES_VALIDLET,
     PDT_DES_WORPLANE,
 )
+from .pdt_api import run  # noqa: F401 - Scripting entry point, pdt.run(obj, command)
 from .pdt_command import command_run
 from .pdt_functions import scale_set
 
@@ -343,6 +349,9 @@ class PDTSceneProperties(PropertyGroup):
     command: StringProperty(
         name="Command", default="CA0,0,0", update=command_run, description=PDT_DES_VALIDLET,
     )
+    command_script: StringProperty(
+        name="Script", default="", subtype="FILE_PATH", description=PDT_DES_SCRIPT,
+    )
     maths_output: FloatProperty(
         name="Maths output", default=0, description=PDT_DES_OUTPUT,
     )
@@ -361,6 +370,12 @@ class PDTSceneProperties(PropertyGroup):
     pivot_width: IntProperty(name="Width", min=1, max=5, default=2, description=PDT_DES_PPWIDTH)
 
     pivot_ang: FloatProperty(name="Pivot Angle", min=-180, max=180, default=0.0)
+    pivot_scale_view: BoolProperty(
+        name="View Scale", default=False, description=PDT_DES_PPSCALEVIEW
+    )
+    pivot_count: IntProperty(
+        name="Copies", min=1, max=10000, default=5, description=PDT_DES_PPCOUNT
+    )
 
     pivot_dis: FloatProperty(
         name="Pivot Dist", default=0.0, min=0, update=scale_set, description=PDT_DES_PIVOTDIS,
@@ -389,6 +404,12 @@ class PDTSceneProperties(PropertyGroup):
     fillet_intersect: BoolProperty(
         name="Intersect", default=False, description=PDT_DES_FILLINT,
     )
+    intersect_planar: BoolProperty(
+        name="Planar", default=False, description=PDT_DES_INTPLANAR,
+    )
+    intersect_incremental: BoolProperty(
+        name="Incremental", default=False, description=PDT_DES_INTINCREMENTAL,
+    )
 
 
 class PDTPreferences(AddonPreferences):
@@ -444,6 +465,7 @@ classes = (
     PDTPreferences,
     pdt_bix.PDT_OT_LineOnBisection,
     pdt_command.PDT_OT_CommandReRun,
+    pdt_command.PDT_OT_CommandScript,
     pdt_design.PDT_OT_PlacementAbs,
     pdt_design.PDT_OT_PlacementDelta,
     pdt_design.PDT_OT_PlacementDis,
@@ -469,6 +491,7 @@ classes = (
     pdt_menus.PDT_PT_PanelPartsLibrary,
     pdt_pivot_point.PDT_OT_ModalDrawOperator,
     pdt_pivot_point.PDT_OT_ViewPlaneRotate,
+    pdt_pivot_point.PDT_OT_PolarArray,
     pdt_pivot_point.PDT_OT_ViewPlaneScale,
     pdt_pivot_point.PDT_OT_PivotToCursor,
     pdt_pivot_point.PDT_OT_CursorToPivot,
@@ -0,0 +1,115 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+"""Run PDT Commands from Python without the UI.
+
+    Note:
+        Example; pdt.run(obj, "ed0.5,,0.6") extrudes the selection of obj and
+        returns a CommandResult, no Popups are shown.
+    """
+
+import bpy
+import bmesh
+from collections import namedtuple
+from time import perf_counter
+from .pdt_command import command_execute
+from .pdt_functions import collected_messages
+from . import pdt_exception
+
+PDT_Error = pdt_exception.PDTError
+PDT_CommandFailure = pdt_exception.CommandFailure
+
+CommandResult = namedtuple(
+    "CommandResult", ("command", "status", "errors", "time", "verts", "edges", "faces")
+)
+CommandResult.__doc__ = """Outcome of a PDT Command.
+
+    Attributes:
+        command: The Command String
+        status: "FINISHED", or "CANCELLED" if the Command failed
+        errors: Tuple of Error Messages reported by the Command
+        time: Run Time in Seconds
+        verts, edges, faces: Number of Elements added, negative if removed
+    """
+
+
+def element_counts(obj):
+    """Return the Number of Vertices, Edges & Faces of an Object's Mesh.
+
+    Args:
+        obj: The Object, any type
+
+    Returns:
+        Tuple of 3 Integers, all 0 if the Object has no Mesh.
+    """
+
+    if obj is None or obj.type != "MESH":
+        return 0, 0, 0
+    if obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(obj.data)
+        return len(bm.verts), len(bm.edges), len(bm.faces)
+    mesh = obj.data
+    return len(mesh.vertices), len(mesh.edges), len(mesh.polygons)
+
+
+def run(obj, command, context=None, raise_errors=False):
+    """Run a PDT Command on an Object.
+
+    Note:
+        The Object is made Active and the Command runs as if typed in the
+        Command Line, Errors are returned in the result instead of Popups.
+
+    Args:
+        obj: The Object to work on, None to use the current Active Object
+        command: The Command String, e.g. "ed0.5,,0.6"
+        context: Blender bpy.context instance, bpy.context if not given
+        raise_errors: Raise PDT_CommandFailure instead of returning a failed result
+
+    Returns:
+        CommandResult.
+    """
+
+    if context is None:
+        context = bpy.context
+    if obj is not None:
+        context.view_layer.objects.active = obj
+    obj = context.view_layer.objects.active
+    counts = element_counts(obj)
+
+    start = perf_counter()
+    with collected_messages() as messages:
+        try:
+            success = command_execute(context, command.strip())
+        except PDT_Error:
+            success = False
+    run_time = perf_counter() - start
+
+    errors = tuple(message for icon, message in messages if icon == "ERROR")
+    success = success and not errors
+    if not success and raise_errors:
+        raise PDT_CommandFailure(errors[0] if errors else command)
+
+    added = [new - old for new, old in zip(element_counts(obj), counts)]
+    return CommandResult(
+        command, "FINISHED" if success else "CANCELLED", errors, run_time, *added
+    )
@@ -26,13 +26,14 @@
 #
 import bpy
 import bmesh
+from mathutils import Vector
 from . import pdt_cad_module as cm
 from .pdt_msg_strings import (
     PDT_ERR_2CPNPE,
     PDT_ERR_NCEDGES,
     PDT_ERR_EDOB_MODE,
 )
-from .pdt_functions import debug, oops
+from .pdt_functions import debug, show_message, update_edit_mesh, weld_vertices
 
 
 def add_line_to_bisection(context):
@@ -58,10 +59,13 @@ def add_line_to_bisection(context):
 
         if not len(edges) == 2:
             pg.error = f"{PDT_ERR_2CPNPE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
 
-        [[vector_a, vector_b], [vector_c, vector_d]] = [[v.co for v in e.verts] for e in edges]
+        table = cm.EdgeTable(bm, [e.index for e in edges])
+        [[vector_a, vector_b], [vector_c, vector_d]] = [
+            [Vector(co) for co in edge] for edge in table.coords.tolist()
+        ]
         debug(f"vectors found:\n {vector_a}\n {vector_b}\n {vector_c}\n {vector_d}")
 
         dist1 = (vector_a - vector_b).length
@@ -72,7 +76,7 @@ def add_line_to_bisection(context):
 
         if not cm.test_coplanar(edge1, edge2):
             pg.error = PDT_ERR_NCEDGES
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
 
         # get intersect_point and pick farthest vertex from (projected) intersections
@@ -100,11 +104,11 @@ def add_line_to_bisection(context):
         vec3 = bm.verts.new(intersect_point3)
         bm.edges.new((vec1, vec2))
         bm.edges.new((vec2, vec3))
-        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
-        bmesh.update_edit_mesh(obj_data)
+        weld_vertices(bm, [vec1, vec2, vec3, *edges[0].verts, *edges[1].verts])
+        update_edit_mesh(obj_data)
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
 
 
@@ -24,9 +24,25 @@
 # ----------------------------------------------------------
 #
 import bmesh
+import numpy as np
 from mathutils import Vector
 from mathutils.geometry import intersect_line_line, intersect_point_line
 from .pdt_functions import debug
+from .pdt_geometry import (  # noqa: F401 - Array kernels are used through this module
+    broad_phase_pairs,
+    count_edges_points_lie_on,
+    grid_cell_size,
+    grid_cells,
+    grid_span,
+    intersect_edges_batch,
+    intersect_segments_2d,
+    num_edges_points_lie_on,
+    pairs_share_vertex,
+    point_edge_pairs,
+    point_params_on_edges,
+    points_on_edges,
+    sweep_line_pairs,
+)
 
 
 def point_on_edge(point, edge):
@@ -258,3 +274,150 @@ def vert_idxs_from_edge_idx(bm, idx):
 
     edge = bm.edges[idx]
     return edge.verts[0].index, edge.verts[1].index
+
+
+def coords_from_edge_indices(bm, edge_indices):
+    """Return Array of Edge End Coordinates.
+
+    Args:
+        bm: Object's Bmesh
+        edge_indices: List of Edge Indices
+
+    Returns:
+        Float Array of shape (len(edge_indices), 2, 3).
+    """
+
+    coords = [v.co[:] for idx in edge_indices for v in bm.edges[idx].verts]
+    return np.array(coords, dtype=np.float64).reshape(-1, 2, 3)
+
+
+def vert_indices_from_edge_indices(bm, edge_indices):
+    """Return Array of Edge Vertex Indices.
+
+    Args:
+        bm: Object's Bmesh
+        edge_indices: List of Edge Indices
+
+    Returns:
+        Integer Array of shape (len(edge_indices), 2).
+    """
+
+    indices = [v.index for idx in edge_indices for v in bm.edges[idx].verts]
+    return np.array(indices, dtype=np.int64).reshape(-1, 2)
+
+
+class EdgeTable:
+    """Arrays of Edge Vertex Indices and End Coordinates read once from a Bmesh.
+
+    Note:
+        Built once per operation, so the batch helpers below read contiguous
+        Arrays instead of going back to bm.verts & bm.edges for every Edge.
+
+    Args:
+        bm: Object's Bmesh
+        edge_indices: List of Edge Indices to hold
+
+    Attributes:
+        edge_indices: Integer Array (N) of Edge Indices
+        vert_indices: Integer Array (N, 2) of Edge Vertex Indices
+        coords: Float Array (N, 2, 3) of Edge End Coordinates
+    """
+
+    def __init__(self, bm, edge_indices):
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        self.edge_indices = np.asarray(edge_indices, dtype=np.int32).reshape(-1)
+        self.vert_indices = vert_indices_from_edge_indices(bm, edge_indices).astype(np.int32)
+        self.coords = coords_from_edge_indices(bm, edge_indices)
+        self._edge_rows = None
+        self._vert_rows = None
+
+    def __len__(self):
+        return len(self.edge_indices)
+
+    def rows(self, edge_indices):
+        """Return the Rows of Edge Indices in the Table.
+
+        Args:
+            edge_indices: Integer Array, or nested List, of Edge Indices
+
+        Returns:
+            Integer Array of Rows, in the shape of edge_indices.
+        """
+
+        if self._edge_rows is None:
+            self._edge_rows = np.full(self.edge_indices.max(initial=-1) + 1, -1, dtype=np.int64)
+            self._edge_rows[self.edge_indices] = np.arange(len(self.edge_indices))
+        return self._edge_rows[np.asarray(edge_indices, dtype=np.int64)]
+
+    def vert_rows(self, vert_indices):
+        """Return Rows into the flattened End Coordinates for Vertex Indices.
+
+        Args:
+            vert_indices: Integer Array, or nested List, of Vertex Indices
+
+        Returns:
+            Integer Array of Rows, in the shape of vert_indices.
+        """
+
+        if self._vert_rows is None:
+            flat = self.vert_indices.reshape(-1)
+            self._vert_rows = np.full(flat.max(initial=-1) + 1, -1, dtype=np.int64)
+            self._vert_rows[flat] = np.arange(len(flat))
+        return self._vert_rows[np.asarray(vert_indices, dtype=np.int64)]
+
+
+def coords_tuples_from_edge_indices(table, edge_indices):
+    """Return End Coordinates of many Edges, batch version of coords_tuple_from_edge_idx.
+
+    Args:
+        table: EdgeTable holding the Edges
+        edge_indices: Integer Array (N) of Edge Indices
+
+    Returns:
+        Float Array (N, 2, 3).
+    """
+
+    return table.coords[table.rows(edge_indices)]
+
+
+def vectors_from_vert_indices(table, vert_indices):
+    """Return Coordinates of many Vertices, batch version of vectors_from_indices.
+
+    Args:
+        table: EdgeTable holding Edges that use the Vertices
+        vert_indices: Integer Array (..., N) of Vertex Indices
+
+    Returns:
+        Float Array (..., N, 3).
+    """
+
+    return table.coords.reshape(-1, 3)[table.vert_rows(vert_indices)]
+
+
+def vertex_indices_from_edge_tuples(table, edge_tuples):
+    """Return Vertex Indices of many Edge Pairs, batch version of vertex_indices_from_edges_tuple.
+
+    Args:
+        table: EdgeTable holding the Edges
+        edge_tuples: Integer Array (P, 2) of Pairs of Edge Indices
+
+    Returns:
+        Integer Array (P, 4).
+    """
+
+    return table.vert_indices[table.rows(edge_tuples)].reshape(-1, 4)
+
+
+def vert_idxs_from_edge_indices(table, edge_indices):
+    """Return Vertex Indices of many Edges, batch version of vert_idxs_from_edge_idx.
+
+    Args:
+        table: EdgeTable holding the Edges
+        edge_indices: Integer Array (N) of Edge Indices
+
+    Returns:
+        Integer Array (N, 2).
+    """
+
+    return table.vert_indices[table.rows(edge_indices)]
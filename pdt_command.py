@@ -23,17 +23,35 @@
 #
 import bpy
 import bmesh
-import math
+import numpy as np
+import re
+from bpy.props import StringProperty
 from bpy.types import Operator
+from collections import namedtuple
+from functools import lru_cache
 from mathutils import Vector
+from .pdt_maths import (
+    ExpressionError,
+    compile_expression,
+    evaluate,
+    evaluate_array,
+    split_expressions,
+)
 from .pdt_functions import (
     debug,
+    deferred_mesh_updates,
+    get_selection,
     intersection,
     obj_check,
-    oops,
+    selection_snapshot,
+    set_locations,
+    show_message,
+    new_vertices_from_array,
+    update_edit_mesh,
     update_sel,
     view_coords,
     view_dir,
+    weld_vertices,
 )
 from .pdt_command_functions import (
     vector_build,
@@ -48,6 +66,9 @@ from .pdt_command_functions import (
 )
 from .pdt_msg_strings import (
     PDT_ERR_ADDVEDIT,
+    PDT_ERR_ARRAYOP,
+    PDT_ERR_BAD3VALS,
+    PDT_ERR_BADCOUNT,
     PDT_ERR_BADFLETTER,
     PDT_ERR_CHARS_NUM,
     PDT_ERR_DUPEDIT,
@@ -66,12 +87,15 @@ from .pdt_msg_strings import (
     PDT_LAB_PLANE,
     PDT_ERR_NO_ACT_OBJ,
     PDT_ERR_VERT_MODE,
+    PDT_ERR_NO_SCRIPT,
+    PDT_ERR_SCRIPT,
 )
 from .pdt_bix import add_line_to_bisection
 from .pdt_etof import extend_vertex
 from .pdt_xall import intersect_all
 
 from . import pdt_exception
+PDT_Error = pdt_exception.PDTError
 PDT_SelectionError = pdt_exception.SelectionError
 PDT_InvalidVector = pdt_exception.InvalidVector
 PDT_CommandFailure = pdt_exception.CommandFailure
@@ -81,6 +105,47 @@ PDT_IntersectionError = pdt_exception.IntersectionError
 PDT_NoObjectError = pdt_exception.NoObjectError
 PDT_FeatureError = pdt_exception.FeatureError
 
+# A Command split into its parts, operation is the upper case first letter, or the
+# whole word of a Tool Command, mode is lower case, values is a tuple of strings &
+# count is the number of repeats given by a *N suffix
+ParsedCommand = namedtuple("ParsedCommand", ("operation", "mode", "values", "count"))
+ParsedCommand.__new__.__defaults__ = (1,)
+
+# Operations that take a *N repeat suffix, e.g. dd0.5,0,0*200
+REPEAT_OPERATIONS = {"D", "E"}
+
+# Values of an Array Command, 3 Coordinate Expressions over an Index from start to stop
+ArrayValues = namedtuple("ArrayValues", ("expressions", "name", "start", "stop"))
+
+# Array Commands, e.g. na i*0.5, sin(i/10), 0 for i in 0..999
+ARRAY_COMMAND = re.compile(
+    r"^(?P<expressions>.+?)\s+for\s+(?P<name>[A-Za-z_]\w*)\s+in\s+"
+    r"(?P<start>[-+]?\d+)\s*\.\.\s*(?P<stop>[-+]?\d+)\s*$",
+    re.IGNORECASE,
+)
+ARRAY_OPERATIONS = {("N", "a"), ("N", "d"), ("V", "a"), ("V", "d")}
+
+# Tool Commands that take no Mode or Values
+TOOL_COMMANDS = {"J2V", "AD2", "AD3", "OTC", "TAP", "BIS", "ETF", "INTALL"}
+
+# Placement Commands, an Operation letter followed by one of these
+PLACEMENT_COMMANDS = {"NML", "CEN", "INT"}
+PLACEMENT_OPERATIONS = {"C", "G", "N", "P", "V"}
+
+# Valid Mode letters for each Operation letter
+OPERATION_MODES = {
+    "C": "adip",
+    "D": "di",
+    "E": "di",
+    "F": "vei",
+    "G": "adip",
+    "M": "adipoxyz",
+    "N": "adip",
+    "P": "adip",
+    "S": "adip",
+    "V": "adip",
+}
+
 
 class PDT_OT_CommandReRun(Operator):
     """Repeat Current Displayed Command."""
@@ -149,165 +214,231 @@ def command_run(self, context):
         Nothing.
     """
 
-    scene = context.scene
-    pg = scene.pdt_pg
-    command = pg.command.strip()
+    command_execute(context, context.scene.pdt_pg.command.strip())
 
-    # Check Object Type & Mode First
-    obj = context.view_layer.objects.active
-    if obj is not None and command[0].upper() not in {"M", "?", "HELP"}:
-        if obj.mode not in {"OBJECT", "EDIT"} or obj.type != "MESH":
-            pg.error = PDT_OBJ_MODE_ERROR
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-            raise PDT_ObjectModeError
+
+def command_execute(context, command):
+    """Run one Command String.
+
+    Note:
+        See command_run for the Command Format.
+
+    Args:
+        context: Blender bpy.context instance.
+        command: The Command String, stripped of surrounding spaces
+
+    Returns:
+        False if the Command failed & was reported, True otherwise.
+    """
+
+    pg = context.scene.pdt_pg
 
     # Special Cases of Command.
+    if command == "":
+        return True
     if command == "?" or command.lower() == "help":
         # fmt: off
         context.window_manager.popup_menu(pdt_help, title="PDT Command Line Help", icon="INFO")
         # fmt: on
-        return
-    if command == "":
-        return
-    if command.upper() == "J2V":
-        join_two_vertices(context)
-        return
-    if command.upper() == "AD2":
-        set_angle_distance_two(context)
-        return
-    if command.upper() == "AD3":
-        set_angle_distance_three(context)
-        return
-    if command.upper() == "OTC":
-        origin_to_cursor(context)
-        return
-    if command.upper() == "TAP":
-        taper(context)
-        return
-    if command.upper() == "BIS":
-        add_line_to_bisection(context)
-        return
-    if command.upper() == "ETF":
-        extend_vertex(context)
-        return
-    if command.upper() == "INTALL":
-        intersect_all(context)
-        return
-    if command.upper()[1:] == "NML":
-        placement_normal(context, command.upper()[0])
-        return
-    if command.upper()[1:] == "CEN":
-        placement_arc_centre(context, command.upper()[0])
-        return
-    if command.upper()[1:] == "INT":
-        placement_intersect(context, command.upper()[0])
-        return
+        return True
+
+    # Check Object Type & Mode First
+    obj = context.view_layer.objects.active
+    if obj is not None and command[0].upper() != "M":
+        if obj.mode not in {"OBJECT", "EDIT"} or obj.type != "MESH":
+            pg.error = PDT_OBJ_MODE_ERROR
+            show_message(context)
+            raise PDT_ObjectModeError
+
+    decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
+    try:
+        parsed = parse_command(command, decimal_places)
+    except PDT_CommandFailure as error:
+        pg.error = str(error)
+        show_message(context)
+        return False
+
+    if isinstance(parsed.values, ArrayValues):
+        handler = run_array
+    else:
+        handler = COMMAND_HANDLERS[parsed.operation, parsed.mode]
+    try:
+        with selection_snapshot():
+            handler(context, pg, parsed)
+    except PDT_Error:
+        return False
+    return True
+
+
+def run_script(context, commands):
+    """Run a Script of Command Strings in one Session.
+
+    Note:
+        Mesh updates are held back until the Script ends, blank lines & lines
+        starting with # are skipped. The Script stops at the first failed Command.
+
+    Args:
+        context: Blender bpy.context instance.
+        commands: Iterable of Command Strings, one per line
+
+    Returns:
+        Line Number of the failed Command, or 0 if all Commands ran.
+    """
+
+    with deferred_mesh_updates():
+        for line, command in enumerate(commands, start=1):
+            command = command.strip()
+            if command == "" or command.startswith("#"):
+                continue
+            try:
+                if not command_execute(context, command):
+                    return line
+            except PDT_Error:
+                return line
+    return 0
+
+
+class PDT_OT_CommandScript(Operator):
+    """Run a Script of PDT Commands as one Operation."""
+
+    bl_idname = "pdt.command_script"
+    bl_label = "Run Command Script"
+    bl_options = {"REGISTER", "UNDO"}
+
+    commands: StringProperty(
+        name="Commands",
+        default="",
+        description="Commands separated by ; or New Lines, the Script File is used if empty",
+    )
+
+    def execute(self, context):
+        """Run Commands from the Script File, or the commands property.
+
+        Note:
+            All Commands form a single Undo step.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        pg = context.scene.pdt_pg
+        if self.commands:
+            commands = self.commands.replace(";", "\n").splitlines()
+        else:
+            file_path = bpy.path.abspath(pg.command_script)
+            try:
+                with open(file_path) as script:
+                    commands = script.read().splitlines()
+            except OSError:
+                pg.error = f"{PDT_ERR_NO_SCRIPT} {file_path}"
+                show_message(context)
+                return {"CANCELLED"}
+
+        line = run_script(context, commands)
+        if line:
+            self.report({"ERROR"}, f"{PDT_ERR_SCRIPT} {line}: {commands[line - 1].strip()}")
+        return {"FINISHED"}
+
+
+@lru_cache(maxsize=256)
+def parse_command(command, decimal_places):
+    """Parse a Command String into its Parts.
+
+    Note:
+        Results are cached by Command String & Rounding, so re-running a Command
+        from the Design Panel, or the Re-run button, does not parse it again.
+
+    Args:
+        command: The Command String, stripped of surrounding spaces
+        decimal_places: The Input Rounding Preference
+
+    Returns:
+        ParsedCommand.
+    """
+
+    command_upper = command.upper()
+    if command_upper in TOOL_COMMANDS:
+        return ParsedCommand(command_upper, "", ())
+    if command_upper[1:] in PLACEMENT_COMMANDS:
+        if command_upper[0] not in PLACEMENT_OPERATIONS:
+            raise PDT_CommandFailure(PDT_ERR_BADFLETTER)
+        return ParsedCommand(command_upper[0], command_upper[1:].lower(), ())
 
     # Check Command Length
     if len(command) < 3:
-        pg.error = PDT_ERR_CHARS_NUM
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
+        raise PDT_CommandFailure(PDT_ERR_CHARS_NUM)
 
     # Check First Letter
-    operation = command[0].upper()
-    if operation not in {"C", "D", "E", "F", "G", "N", "M", "P", "V", "S"}:
-        pg.error = PDT_ERR_BADFLETTER
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
+    operation = command_upper[0]
+    if operation not in OPERATION_MODES:
+        raise PDT_CommandFailure(PDT_ERR_BADFLETTER)
 
     # Check Second Letter.
     mode = command[1].lower()
-    if (
-            (operation == "F" and mode not in {"v", "e", "i"})
-            or (operation in {"D", "E"} and mode not in {"d", "i"})
-            or (operation == "M" and mode not in {"a", "d", "i", "p", "o", "x", "y", "z"})
-            or (operation not in {"D", "E", "F", "M"} and mode not in {"a", "d", "i", "p"})
-        ):
-        pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{operation}'"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
+    if mode not in OPERATION_MODES[operation]:
+        raise PDT_CommandFailure(f"'{mode}' {PDT_ERR_NON_VALID} '{operation}'")
 
-    # --------------
-    # Maths Operation
+    # Maths Expressions are evaluated later, as they are
     if operation == "M":
-        try:
-            command_maths(context, mode, pg, command[2:], mode)
-            return
-        except PDT_MathsError:
-            return
+        return ParsedCommand(operation, mode, (command[2:],))
 
-    # -----------------------------------------------------
-    # Not a Maths Operation, so let's parse the command line
-    try:
-        pg, values, obj, obj_loc, bm, verts = command_parse(context)
-    except PDT_SelectionError:
-        return
+    if ARRAY_COMMAND.match(command[2:].strip()):
+        return ParsedCommand(operation, mode, parse_array(operation, mode, command[2:].strip()))
 
-    # ---------------------
-    # Cursor or Pivot Point
-    if operation in {"C", "P"}:
+    values_text = command[2:]
+    count = 1
+    if operation in REPEAT_OPERATIONS and "*" in values_text:
+        values_text, _, count_text = values_text.rpartition("*")
         try:
-            move_cursor_pivot(context, pg, operation, mode, obj, verts, values)
-        except PDT_CommandFailure:
-            return
+            count = int(count_text)
+        except ValueError:
+            raise PDT_CommandFailure(PDT_ERR_BADCOUNT)
+        if count < 1:
+            raise PDT_CommandFailure(PDT_ERR_BADCOUNT)
 
-    # ------------------------
-    # Move Vertices or Objects
-    if operation == "G":
+    # Missing or bad Values are set to 0, then System Rounding is applied
+    values = []
+    for value in values_text.split(","):
         try:
-            move_entities(context, pg, operation, mode, obj, bm, verts, values)
-        except PDT_CommandFailure:
-            return
+            values.append(str(round(float(value), decimal_places)))
+        except ValueError:
+            values.append(str(round(0.0, decimal_places)))
+    return ParsedCommand(operation, mode, tuple(values), count)
 
-    # --------------
-    # Add New Vertex
-    if operation == "N":
-        try:
-            add_new_vertex(context, pg, operation, mode, obj, bm, verts, values)
-        except PDT_CommandFailure:
-            return
-
-    # -----------
-    # Split Edges
-    if operation == "S":
-        try:
-            split_edges(context, pg, operation, mode, obj, obj_loc, bm, values)
-        except PDT_CommandFailure:
-            return
 
+def parse_array(operation, mode, text):
+    """Parse the Values of an Array Command.
 
-    # ----------------
-    # Extrude Vertices
-    if operation == "V":
-        try:
-            extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, values)
-        except PDT_CommandFailure:
-            return
+    Note:
+        Expressions are checked here, so a bad Command fails before any Geometry
+        is made. Missing Expressions are set to 0.
 
-    # ----------------
-    # Extrude Geometry
-    if operation == "E":
-        try:
-            extrude_geometry(context, pg, operation, mode, obj, bm, values)
-        except PDT_CommandFailure:
-            return
+    Args:
+        operation: The Operation, N or V
+        mode: The Operation Mode, a or d
+        text: The Values, e.g. "i*0.5, sin(i/10), 0 for i in 0..999"
 
-    # ------------------
-    # Duplicate Geometry
-    if operation == "D":
-        try:
-            duplicate_geometry(context, pg, operation, mode, obj, bm, values)
-        except PDT_CommandFailure:
-            return
+    Returns:
+        ArrayValues.
+    """
 
-    # ---------------
-    # Fillet Geometry
-    if operation == "F":
+    if (operation, mode) not in ARRAY_OPERATIONS:
+        raise PDT_CommandFailure(PDT_ERR_ARRAYOP)
+    match = ARRAY_COMMAND.match(text)
+    expressions = [expression or "0" for expression in split_expressions(match["expressions"])]
+    if len(expressions) > 3:
+        raise PDT_CommandFailure(PDT_ERR_BAD3VALS)
+    expressions += ["0"] * (3 - len(expressions))
+    name = match["name"]
+    for expression in expressions:
         try:
-            fillet_geometry(context, pg, mode, obj, bm, verts, values)
-        except PDT_CommandFailure:
-            return
+            compile_expression(expression, (name,), array=True)
+        except ExpressionError as error:
+            raise PDT_CommandFailure(f"{PDT_ERR_BADMATHS} {error}")
+    return ArrayValues(tuple(expressions), name, int(match["start"]), int(match["stop"]))
 
 
 def pdt_help(self, context):
@@ -357,6 +488,12 @@ def pdt_help(self, context):
     label(text="ed0.5,,0.6")
     label(text="'- Extrude Geometry Delta 0.5 in X, 0 in Y, 0.6 in Z")
     label(text="")
+    label(text="na i*0.5, sin(i/10), 0 for i in 0..999")
+    label(text="'- 1000 New Vertices, Coordinates evaluated for i = 0 to 999, V joins them")
+    label(text="")
+    label(text="dd0.5,0,0*200")
+    label(text="'- Duplicate Geometry 200 times, 0.5 apart in X, E also takes *N")
+    label(text="")
     label(text="fe0.1,4,0.5")
     label(text="'- Fillet Edges")
     label(text="'- Radius: 0.1 (float) -- the radius (or offset) of the bevel/fillet")
@@ -381,13 +518,11 @@ def command_maths(context, mode, pg, expression, output_target):
         Nothing.
     """
 
-    namespace = {}
-    namespace.update(vars(math))
     try:
-        maths_result = eval(expression, namespace, namespace)
-    except:
+        maths_result = evaluate(expression)
+    except ExpressionError:
         pg.error = PDT_ERR_BADMATHS
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         raise PDT_MathsError
 
     decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
@@ -408,11 +543,12 @@ def command_maths(context, mode, pg, expression, output_target):
         pg.maths_output = round(maths_result, decimal_places)
 
 
-def command_parse(context):
+def command_parse(context, command=None):
     """Parse Command Input.
 
     Args:
         context: Blender bpy.context instance.
+        command: Optional ParsedCommand, pg.command is parsed if not given
 
     Returns:
         pg: PDT Parameters Group - our variables
@@ -424,23 +560,14 @@ def command_parse(context):
     """
     scene = context.scene
     pg = scene.pdt_pg
-    command = pg.command.strip()
-    operation = command[0].upper()
-    mode = command[1].lower()
-    values = command[2:].split(",")
+    if command is None:
+        decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
+        command = parse_command(pg.command.strip(), decimal_places)
+    operation = command.operation
+    mode = command.mode
+    values_out = list(command.values)
     mode_sel = pg.select
     obj = context.view_layer.objects.active
-    ind = 0
-    for v in values:
-        try:
-            _ = float(v)
-            good = True
-        except ValueError:
-            values[ind] = "0.0"
-        ind = ind + 1
-    # Apply System Rounding
-    decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
-    values_out = [str(round(float(v), decimal_places)) for v in values]
     bm = "No Bmesh"
     obj_loc = Vector((0,0,0))
     verts = []
@@ -461,11 +588,11 @@ def command_parse(context):
                 verts = []
             else:
                 pg.error = PDT_OBJ_MODE_ERROR
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(context)
                 raise PDT_ObjectModeError
         else:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_NoObjectError
 
     if mode_sel == 'SEL' and mode not in {"a"}:
@@ -475,10 +602,10 @@ def command_parse(context):
         if good and obj.mode == 'EDIT':
             obj_loc = obj.matrix_world.decompose()[0]
             if len(bm.select_history) == 0 or operation == "G":
-                verts = [v for v in bm.verts if v.select]
+                verts = get_selection(bm).verts
                 if len(verts) == 0:
                     pg.error = PDT_ERR_NO_SEL_GEOM
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                    show_message(context)
                     raise PDT_SelectionError
             else:
                 verts = bm.select_history
@@ -597,14 +724,12 @@ def move_entities(context, pg, operation, mode, obj, bm, verts, values):
         except:
             raise PDT_InvalidVector
         if obj.mode == "EDIT":
-            for v in verts:
-                v.co = vector_delta - obj_loc
-            bmesh.ops.remove_doubles(
-                bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-            )
+            # All Selected Vertices end up at one place, so merge them there at once
+            verts = get_selection(bm).verts
+            if verts:
+                bmesh.ops.pointmerge(bm, verts=verts, merge_co=vector_delta - obj_loc)
         if obj.mode == "OBJECT":
-            for ob in context.view_layer.objects.selected:
-                ob.location = vector_delta
+            set_locations(context.view_layer.objects.selected, vector_delta)
 
     elif mode in {"d", "i"}:
         if mode == "d":
@@ -627,11 +752,10 @@ def move_entities(context, pg, operation, mode, obj, bm, verts, values):
 
         if obj.mode == "EDIT":
             bmesh.ops.translate(
-                bm, verts=[v for v in bm.verts if v.select], vec=vector_delta
+                bm, verts=get_selection(bm).verts, vec=vector_delta
             )
         if obj.mode == "OBJECT":
-            for ob in context.view_layer.objects.selected:
-                ob.location = obj_loc + vector_delta
+            set_locations(context.view_layer.objects.selected, obj_loc + vector_delta)
     # Percent Options Only Other Choice
     else:
         try:
@@ -643,7 +767,7 @@ def move_entities(context, pg, operation, mode, obj, bm, verts, values):
         if obj.mode == "OBJECT":
             obj.location = vector_delta
     if obj.mode == 'EDIT':
-        bmesh.update_edit_mesh(obj.data)
+        update_edit_mesh(obj.data)
         bm.select_history.clear()
 
 
@@ -662,12 +786,12 @@ def add_new_vertex(context, pg, operation, mode, obj, bm, verts, values):
 
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_ADDVEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         raise PDT_SelectionError
     if mode not in {"a"}:
         if not isinstance(verts[0], bmesh.types.BMVert):
             pg.error = PDT_ERR_VERT_MODE
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_FeatureError
     # Absolute/Global Coordinates
     if mode == "a":
@@ -702,10 +826,70 @@ def add_new_vertex(context, pg, operation, mode, obj, bm, verts, values):
             raise PDT_InvalidVector
         new_vertex = bm.verts.new(vector_delta)
 
-    for v in [v for v in bm.verts if v.select]:
+    for v in get_selection(bm).verts:
         v.select_set(False)
     new_vertex.select_set(True)
-    bmesh.update_edit_mesh(obj.data)
+    update_edit_mesh(obj.data)
+    bm.select_history.clear()
+
+
+def add_vertex_array(context, pg, operation, mode, obj, bm, verts, values):
+    """Add a Series of New Vertices from an Array Command.
+
+    Note:
+        All Coordinates are evaluated at once over the Index range and the
+        Vertices added in one batch. V joins them with Edges, in d mode from
+        the Active Vertex.
+
+    Args:
+        context: Blender bpy.context instance.
+        pg, operation, mode, obj, bm, verts
+        values: ArrayValues of the Command
+
+    Returns:
+        Nothing.
+    """
+
+    if not obj.mode == "EDIT":
+        pg.error = PDT_ERR_ADDVEDIT if operation == "N" else PDT_ERR_EXTEDIT
+        show_message(context)
+        raise PDT_SelectionError
+    if mode == "d" and not isinstance(verts[-1], bmesh.types.BMVert):
+        pg.error = PDT_ERR_VERT_MODE
+        show_message(context)
+        raise PDT_FeatureError
+
+    step = 1 if values.stop >= values.start else -1
+    index = np.arange(values.start, values.stop + step, step)
+    try:
+        coords = np.column_stack(
+            [evaluate_array(expression, **{values.name: index}) for expression in values.expressions]
+        )
+    except ExpressionError as error:
+        pg.error = f"{PDT_ERR_BADMATHS} {error}"
+        show_message(context)
+        raise PDT_MathsError
+    decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
+    coords = np.round(coords, decimal_places)
+
+    start_vertex = None
+    # Absolute/Global Coordinates
+    if mode == "a":
+        coords -= np.array(obj.matrix_world.decompose()[0])
+    # Delta/Relative Coordinates
+    else:
+        if pg.plane == "LO":
+            # Rows are the View Axes, as view_coords applies the inverted View Matrix
+            coords = coords @ np.array([view_coords(*axis) for axis in np.eye(3)])
+        start_vertex = verts[-1]
+        coords += np.array(start_vertex.co)
+
+    for v in get_selection(bm).verts:
+        v.select_set(False)
+    new_vertices_from_array(
+        bm, coords, connect=operation == "V", start_vertex=start_vertex if operation == "V" else None
+    )
+    update_edit_mesh(obj.data)
     bm.select_history.clear()
 
 
@@ -729,7 +913,7 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
 
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_SPLITEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
     # Absolute/Global Coordinates
     if mode == "a":
@@ -737,10 +921,10 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
             vector_delta = vector_build(context, pg, obj, operation, values, 3)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
+        edges = get_selection(bm).edges
         if len(edges) != 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGE} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
@@ -752,15 +936,15 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
             vector_delta = vector_build(context, pg, obj, operation, values, 3)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
-        faces = [f for f in bm.faces if f.select]
+        edges = get_selection(bm).edges
+        faces = get_selection(bm).faces
         if len(faces) != 0:
             pg.error = PDT_ERR_FACE_SEL
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
         if len(edges) < 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
@@ -771,15 +955,15 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
             vector_delta = vector_build(context, pg, obj, operation, values, 2)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
-        faces = [f for f in bm.faces if f.select]
+        edges = get_selection(bm).edges
+        faces = get_selection(bm).faces
         if len(faces) != 0:
             pg.error = PDT_ERR_FACE_SEL
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
         if len(edges) < 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
@@ -790,26 +974,26 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
             vector_delta = vector_build(context, pg, obj, operation, values, 1)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
-        faces = [f for f in bm.faces if f.select]
+        edges = get_selection(bm).edges
+        faces = get_selection(bm).faces
         if len(faces) != 0:
             pg.error = PDT_ERR_FACE_SEL
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
         if len(edges) != 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
         new_vertex = new_verts[0]
         new_vertex.co = vector_delta
 
-    for v in [v for v in bm.verts if v.select]:
+    for v in get_selection(bm).verts:
         v.select_set(False)
     for v in new_verts:
         v.select_set(False)
-    bmesh.update_edit_mesh(obj.data)
+    update_edit_mesh(obj.data)
     bm.select_history.clear()
 
 
@@ -833,7 +1017,7 @@ def extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, valu
 
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_EXTEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
     # Absolute/Global Coordinates
     if mode == "a":
@@ -842,14 +1026,11 @@ def extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, valu
         except:
             raise PDT_InvalidVector
         new_vertex = bm.verts.new(vector_delta - obj_loc)
-        verts = [v for v in bm.verts if v.select].copy()
+        verts = get_selection(bm).verts.copy()
         for v in verts:
             bm.edges.new([v, new_vertex])
             v.select_set(False)
         new_vertex.select_set(True)
-        bmesh.ops.remove_doubles(
-            bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-        )
     # Delta/Relative Coordinates
     elif mode == "d":
         try:
@@ -885,22 +1066,26 @@ def extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, valu
             vector_delta = vector_build(context, pg, obj, operation, values, 1)
         except:
             raise PDT_InvalidVector
-        verts = [v for v in bm.verts if v.select].copy()
+        verts = get_selection(bm).verts.copy()
         new_vertex = bm.verts.new(vector_delta)
         if extend_all:
-            for v in [v for v in bm.verts if v.select]:
+            for v in get_selection(bm).verts:
                 bm.edges.new([v, new_vertex])
                 v.select_set(False)
         else:
             bm.edges.new([verts[-1], new_vertex])
         new_vertex.select_set(True)
 
-    bmesh.update_edit_mesh(obj.data)
+    update_edit_mesh(obj.data)
 
 
-def extrude_geometry(context, pg, operation, mode, obj, bm, values):
+def extrude_geometry(context, pg, operation, mode, obj, bm, values, count=1):
     """Extrude Geometry.
 
+    Note:
+        With a count, each Extrusion is made from the last one, then the
+        Selection & Edit Mesh are updated once at the end.
+
     Args:
         context: Blender bpy.context instance.
         pg: PDT Parameters Group - our variables
@@ -909,6 +1094,7 @@ def extrude_geometry(context, pg, operation, mode, obj, bm, values):
         obj: The Active Object
         bm: The object's Bmesh
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
+        count: Number of Extrusions
 
     Returns:
         Nothing.
@@ -916,7 +1102,7 @@ def extrude_geometry(context, pg, operation, mode, obj, bm, values):
 
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_EXTEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
     # Delta/Relative Coordinates
     if mode == "d":
@@ -931,35 +1117,32 @@ def extrude_geometry(context, pg, operation, mode, obj, bm, values):
         except:
             raise PDT_InvalidVector
 
-    ret = bmesh.ops.extrude_face_region(
-        bm,
-        geom=(
-            [f for f in bm.faces if f.select]
-            + [e for e in bm.edges if e.select]
-            + [v for v in bm.verts if v.select]
-        ),
-        use_select_history=True,
-    )
-    geom_extr = ret["geom"]
-    verts_extr = [v for v in geom_extr if isinstance(v, bmesh.types.BMVert)]
-    edges_extr = [e for e in geom_extr if isinstance(e, bmesh.types.BMEdge)]
-    faces_extr = [f for f in geom_extr if isinstance(f, bmesh.types.BMFace)]
-    del ret
-
     if pg.plane == "LO" and mode == "d":
         vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
     elif pg.plane == "LO" and mode == "i":
         vector_delta = view_dir(pg.distance, pg.angle)
 
-    bmesh.ops.translate(bm, verts=verts_extr, vec=vector_delta)
+    geom_extr = get_selection(bm).geom
+    for _ in range(count):
+        ret = bmesh.ops.extrude_face_region(bm, geom=geom_extr, use_select_history=True)
+        geom_extr = ret["geom"]
+        del ret
+        verts_extr = [v for v in geom_extr if isinstance(v, bmesh.types.BMVert)]
+        bmesh.ops.translate(bm, verts=verts_extr, vec=vector_delta)
+    edges_extr = [e for e in geom_extr if isinstance(e, bmesh.types.BMEdge)]
+    faces_extr = [f for f in geom_extr if isinstance(f, bmesh.types.BMFace)]
+
     update_sel(bm, verts_extr, edges_extr, faces_extr)
-    bmesh.update_edit_mesh(obj.data)
+    update_edit_mesh(obj.data)
     bm.select_history.clear()
 
 
-def duplicate_geometry(context, pg, operation, mode, obj, bm, values):
+def duplicate_geometry(context, pg, operation, mode, obj, bm, values, count=1):
     """Duplicate Geometry.
 
+    Note:
+        With a count, a Linear Array of Copies is made, the last one is selected.
+
     Args:
         context: Blender bpy.context instance.
         pg: PDT Parameters Group - our variables
@@ -968,6 +1151,7 @@ def duplicate_geometry(context, pg, operation, mode, obj, bm, values):
         obj: The Active Object
         bm: The object's Bmesh
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
+        count: Number of Copies
 
     Returns:
         Nothing.
@@ -975,7 +1159,7 @@ def duplicate_geometry(context, pg, operation, mode, obj, bm, values):
 
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_DUPEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
     # Delta/Relative Coordinates
     if mode == "d":
@@ -990,29 +1174,23 @@ def duplicate_geometry(context, pg, operation, mode, obj, bm, values):
         except:
             raise PDT_InvalidVector
 
-    ret = bmesh.ops.duplicate(
-        bm,
-        geom=(
-            [f for f in bm.faces if f.select]
-            + [e for e in bm.edges if e.select]
-            + [v for v in bm.verts if v.select]
-        ),
-        use_select_history=True,
-    )
-    geom_dupe = ret["geom"]
-    verts_dupe = [v for v in geom_dupe if isinstance(v, bmesh.types.BMVert)]
-    edges_dupe = [e for e in geom_dupe if isinstance(e, bmesh.types.BMEdge)]
-    faces_dupe = [f for f in geom_dupe if isinstance(f, bmesh.types.BMFace)]
-    del ret
-
     if pg.plane == "LO" and mode == "d":
         vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
     elif pg.plane == "LO" and mode == "i":
         vector_delta = view_dir(pg.distance, pg.angle)
 
-    bmesh.ops.translate(bm, verts=verts_dupe, vec=vector_delta)
+    geom = get_selection(bm).geom
+    for step in range(1, count + 1):
+        ret = bmesh.ops.duplicate(bm, geom=geom, use_select_history=True)
+        geom_dupe = ret["geom"]
+        del ret
+        verts_dupe = [v for v in geom_dupe if isinstance(v, bmesh.types.BMVert)]
+        bmesh.ops.translate(bm, verts=verts_dupe, vec=vector_delta * step)
+    edges_dupe = [e for e in geom_dupe if isinstance(e, bmesh.types.BMEdge)]
+    faces_dupe = [f for f in geom_dupe if isinstance(f, bmesh.types.BMFace)]
+
     update_sel(bm, verts_dupe, edges_dupe, faces_dupe)
-    bmesh.update_edit_mesh(obj.data)
+    update_edit_mesh(obj.data)
 
 
 def fillet_geometry(context, pg, mode, obj, bm, verts, values):
@@ -1034,7 +1212,7 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
 
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_FILEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
     if mode in {"i", "v"}:
         vert_bool = True
@@ -1053,8 +1231,8 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
     if mode == "i":
         # Fillet & Intersect Two Edges
         # Always use Current Selection
-        verts = [v for v in bm.verts if v.select]
-        edges = [e for e in bm.edges if e.select]
+        verts = get_selection(bm).verts
+        edges = get_selection(bm).edges
         if len(edges) == 2 and len(verts) == 4:
             plane = pg.plane
             v_active = edges[0].verts[0]
@@ -1069,7 +1247,7 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
                                               )
             if not done:
                 pg.error = f"{PDT_ERR_INT_LINES} {plane}  {PDT_LAB_PLANE}"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(context)
                 raise PDT_IntersectionError
             if (v_active.co - vector_delta).length < (v_other.co - vector_delta).length:
                 v_active.co = vector_delta
@@ -1083,10 +1261,10 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
             else:
                 v_first.co = vector_delta
                 v_last.select_set(False)
-            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+            weld_vertices(bm, [v_active, v_other, v_last, v_first])
         else:
             pg.error = f"{PDT_ERR_SEL_4_VERTS} {len(verts)} Vert(s), {len(edges)} Edge(s))"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
 
     bpy.ops.mesh.bevel(
@@ -1096,3 +1274,130 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
         profile=_profile,
         vertex_only=vert_bool
     )
+
+
+def run_tool(function):
+    """Make a Command Handler for a Tool that only needs the Context.
+
+    Args:
+        function: Tool Function taking the Context
+
+    Returns:
+        Command Handler.
+    """
+
+    def handler(context, pg, command):
+        function(context)
+
+    return handler
+
+
+def run_placement(function):
+    """Make a Command Handler for a Placement Tool.
+
+    Args:
+        function: Placement Function taking the Context & Operation letter
+
+    Returns:
+        Command Handler.
+    """
+
+    def handler(context, pg, command):
+        function(context, command.operation)
+
+    return handler
+
+
+def run_maths(context, pg, command):
+    """Command Handler for Maths Operations."""
+    command_maths(context, command.mode, pg, command.values[0], command.mode)
+
+
+def run_cursor_pivot(context, pg, command):
+    """Command Handler for Cursor or Pivot Point."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    move_cursor_pivot(context, pg, command.operation, command.mode, obj, verts, values)
+
+
+def run_move(context, pg, command):
+    """Command Handler for Move Vertices or Objects."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    move_entities(context, pg, command.operation, command.mode, obj, bm, verts, values)
+
+
+def run_new_vertex(context, pg, command):
+    """Command Handler for Add New Vertex."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    add_new_vertex(context, pg, command.operation, command.mode, obj, bm, verts, values)
+
+
+def run_array(context, pg, command):
+    """Command Handler for Array Commands."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    add_vertex_array(context, pg, command.operation, command.mode, obj, bm, verts, command.values)
+
+
+def run_split(context, pg, command):
+    """Command Handler for Split Edges."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    split_edges(context, pg, command.operation, command.mode, obj, obj_loc, bm, values)
+
+
+def run_extrude_vertices(context, pg, command):
+    """Command Handler for Extrude Vertices."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    extrude_vertices(
+        context, pg, command.operation, command.mode, obj, obj_loc, bm, verts, values
+    )
+
+
+def run_extrude_geometry(context, pg, command):
+    """Command Handler for Extrude Geometry."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    extrude_geometry(context, pg, command.operation, command.mode, obj, bm, values, command.count)
+
+
+def run_duplicate(context, pg, command):
+    """Command Handler for Duplicate Geometry."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    duplicate_geometry(context, pg, command.operation, command.mode, obj, bm, values, command.count)
+
+
+def run_fillet(context, pg, command):
+    """Command Handler for Fillet Geometry."""
+    pg, values, obj, obj_loc, bm, verts = command_parse(context, command)
+    fillet_geometry(context, pg, command.mode, obj, bm, verts, values)
+
+
+# Command Handlers by (Operation, Mode), each is called with (context, pg, ParsedCommand)
+COMMAND_HANDLERS = {
+    ("J2V", ""): run_tool(join_two_vertices),
+    ("AD2", ""): run_tool(set_angle_distance_two),
+    ("AD3", ""): run_tool(set_angle_distance_three),
+    ("OTC", ""): run_tool(origin_to_cursor),
+    ("TAP", ""): run_tool(taper),
+    ("BIS", ""): run_tool(add_line_to_bisection),
+    ("ETF", ""): run_tool(extend_vertex),
+    ("INTALL", ""): run_tool(intersect_all),
+}
+for _operation, _handler in (
+        ("C", run_cursor_pivot),
+        ("P", run_cursor_pivot),
+        ("G", run_move),
+        ("N", run_new_vertex),
+        ("S", run_split),
+        ("V", run_extrude_vertices),
+        ("E", run_extrude_geometry),
+        ("D", run_duplicate),
+        ("F", run_fillet),
+        ("M", run_maths),
+    ):
+    COMMAND_HANDLERS.update({(_operation, mode): _handler for mode in OPERATION_MODES[_operation]})
+for _placement, _function in (
+        ("nml", placement_normal),
+        ("cen", placement_arc_centre),
+        ("int", placement_intersect),
+    ):
+    COMMAND_HANDLERS.update(
+        {(operation, _placement): run_placement(_function) for operation in PLACEMENT_OPERATIONS}
+    )
@@ -21,23 +21,27 @@
 # Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
 # -----------------------------------------------------------------------
 #
+import bpy
 import bmesh
 import numpy as np
 from math import sqrt, tan, pi
-from mathutils import Vector
+from mathutils import Matrix, Vector
 from mathutils.geometry import intersect_point_line
 from .pdt_functions import (
     set_mode,
-    oops,
+    show_message,
     get_percent,
     dis_ang,
     check_selection,
+    deselect_all,
+    get_selection,
     arc_centre,
     intersection,
     view_coords_i,
-    view_coords,
-    view_dir,
+    view_matrix_inverted,
     set_axis,
+    update_edit_mesh,
+    weld_vertices,
 )
 
 from . import pdt_exception
@@ -59,6 +63,7 @@ from .pdt_msg_strings import (
     PDT_ERR_SEL_2_VERTS,
     PDT_ERR_EDOB_MODE,
     PDT_ERR_NO_ACT_OBJ,
+    PDT_ERR_FLATOBJ,
     PDT_ERR_VERT_MODE,
     PDT_ERR_SEL_3_VERTS,
     PDT_ERR_SEL_3_OBJS,
@@ -118,7 +123,7 @@ def vector_build(context, pg, obj, operation, values, num_values):
             pg.error = PDT_ERR_BAD2VALS
         else:
             pg.error = PDT_ERR_BAD1VALS
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         raise PDT_InvalidVector
     return output_vector
 
@@ -142,7 +147,7 @@ def placement_normal(context, operation):
     if obj.mode == "EDIT":
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_ObjectModeError
         obj_loc = obj.matrix_world.decompose()[0]
         bm = bmesh.from_edit_mesh(obj.data)
@@ -150,17 +155,17 @@ def placement_normal(context, operation):
             vector_a, vector_b, vector_c = check_selection(3, bm, obj)
             if vector_a is None:
                 pg.error = PDT_ERR_VERT_MODE
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(context)
                 raise PDT_FeatureError
         else:
             pg.error = f"{PDT_ERR_SEL_3_VERTIO} {len(bm.select_history)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
     elif obj.mode == "OBJECT":
         objs = context.view_layer.objects.selected
         if len(objs) != 3:
             pg.error = f"{PDT_ERR_SEL_3_OBJS} {len(objs)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
         objs_s = [ob for ob in objs if ob.name != obj.name]
         vector_a = obj.matrix_world.decompose()[0]
@@ -180,44 +185,45 @@ def placement_normal(context, operation):
     elif operation == "G":
         if obj.mode == "EDIT":
             if extend_all:
-                for v in [v for v in bm.verts if v.select]:
+                verts = get_selection(bm).verts
+                for v in verts:
                     v.co = vector_delta
                 bm.select_history.clear()
-                bmesh.ops.remove_doubles(bm, verts=[v for v in bm.verts if v.select], dist=0.0001)
+                weld_vertices(bm, verts, neighbours=False)
             else:
                 bm.select_history[-1].co = vector_delta
                 bm.select_history.clear()
-            bmesh.update_edit_mesh(obj.data)
+            update_edit_mesh(obj.data)
         elif obj.mode == "OBJECT":
             context.view_layer.objects.active.location = vector_delta
     elif operation == "N":
         if obj.mode == "EDIT":
             vertex_new = bm.verts.new(vector_delta)
-            bmesh.update_edit_mesh(obj.data)
+            update_edit_mesh(obj.data)
             bm.select_history.clear()
-            for v in [v for v in bm.verts if v.select]:
+            for v in get_selection(bm).verts:
                 v.select_set(False)
             vertex_new.select_set(True)
         else:
             pg.error = f"{PDT_ERR_EDIT_MODE} {obj.mode})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
     elif operation == "V" and obj.mode == "EDIT":
         vector_new = vector_delta
         vertex_new = bm.verts.new(vector_new)
         if extend_all:
-            for v in [v for v in bm.verts if v.select]:
+            for v in get_selection(bm).verts:
                 bm.edges.new([v, vertex_new])
         else:
             bm.edges.new([bm.select_history[-1], vertex_new])
-        for v in [v for v in bm.verts if v.select]:
+        for v in get_selection(bm).verts:
             v.select_set(False)
         vertex_new.select_set(True)
-        bmesh.update_edit_mesh(obj.data)
+        update_edit_mesh(obj.data)
         bm.select_history.clear()
     else:
         pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_NOR}"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
 
 
 def placement_arc_centre(context, operation):
@@ -239,15 +245,15 @@ def placement_arc_centre(context, operation):
     if obj.mode == "EDIT":
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_ObjectModeError
         obj = context.view_layer.objects.active
         obj_loc = obj.matrix_world.decompose()[0]
         bm = bmesh.from_edit_mesh(obj.data)
-        verts = [v for v in bm.verts if v.select]
+        verts = get_selection(bm).verts
         if len(verts) != 3:
             pg.error = f"{PDT_ERR_SEL_3_VERTS} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
         vector_a = verts[0].co
         vector_b = verts[1].co
@@ -255,7 +261,7 @@ def placement_arc_centre(context, operation):
         vector_delta, radius = arc_centre(vector_a, vector_b, vector_c)
         if str(radius) == "inf":
             pg.error = PDT_ERR_STRIGHT_LINE
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_InfRadius
         pg.distance = radius
         if operation == "C":
@@ -265,43 +271,43 @@ def placement_arc_centre(context, operation):
         elif operation == "N":
             vector_new = vector_delta
             vertex_new = bm.verts.new(vector_new)
-            for v in [v for v in bm.verts if v.select]:
+            for v in get_selection(bm).verts:
                 v.select_set(False)
             vertex_new.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
+            update_edit_mesh(obj.data)
             bm.select_history.clear()
             vertex_new.select_set(True)
         elif operation == "G":
             if extend_all:
-                for v in [v for v in bm.verts if v.select]:
+                verts = get_selection(bm).verts
+                for v in verts:
                     v.co = vector_delta
                 bm.select_history.clear()
-                bmesh.ops.remove_doubles(bm, verts=[v for v in bm.verts if v.select], dist=0.0001)
+                weld_vertices(bm, verts, neighbours=False)
             else:
                 bm.select_history[-1].co = vector_delta
                 bm.select_history.clear()
-            bmesh.update_edit_mesh(obj.data)
+            update_edit_mesh(obj.data)
         elif operation == "V":
             vertex_new = bm.verts.new(vector_delta)
             if extend_all:
-                for v in [v for v in bm.verts if v.select]:
+                for v in get_selection(bm).verts:
                     bm.edges.new([v, vertex_new])
                     v.select_set(False)
                 vertex_new.select_set(True)
                 bm.select_history.clear()
-                bmesh.ops.remove_doubles(bm, verts=[v for v in bm.verts if v.select], dist=0.0001)
-                bmesh.update_edit_mesh(obj.data)
+                update_edit_mesh(obj.data)
             else:
                 bm.edges.new([bm.select_history[-1], vertex_new])
-                bmesh.update_edit_mesh(obj.data)
+                update_edit_mesh(obj.data)
                 bm.select_history.clear()
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_ARCCENTRE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
     elif obj.mode == "OBJECT":
         if len(context.view_layer.objects.selected) != 3:
             pg.error = f"{PDT_ERR_SEL_3_OBJS} {len(context.view_layer.objects.selected)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
         vector_a = context.view_layer.objects.selected[0].matrix_world.decompose()[0]
         vector_b = context.view_layer.objects.selected[1].matrix_world.decompose()[0]
@@ -316,7 +322,7 @@ def placement_arc_centre(context, operation):
             context.view_layer.objects.active.location = vector_delta
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_ARCCENTRE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
 
 
 def placement_intersect(context, operation):
@@ -337,11 +343,11 @@ def placement_intersect(context, operation):
     if obj.mode == "EDIT":
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_NoObjectError
         obj_loc = obj.matrix_world.decompose()[0]
         bm = bmesh.from_edit_mesh(obj.data)
-        edges = [e for e in bm.edges if e.select]
+        edges = get_selection(bm).edges
         extend_all = pg.extend
 
         if len(edges) == 2:
@@ -358,7 +364,7 @@ def placement_intersect(context, operation):
                     + str(len(edges))
                     + " Edges)"
                 )
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(context)
                 raise PDT_SelectionError
             vertex_a = bm.select_history[-1]
             vertex_b = bm.select_history[-2]
@@ -368,7 +374,7 @@ def placement_intersect(context, operation):
         vector_delta, done = intersection(vertex_a.co, vertex_b.co, vertex_c.co, vertex_d.co, plane)
         if not done:
             pg.error = f"{PDT_ERR_INT_LINES} {plane}  {PDT_LAB_PLANE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_IntersectionError
 
         if operation == "C":
@@ -378,14 +384,9 @@ def placement_intersect(context, operation):
         elif operation == "N":
             vector_new = vector_delta
             vertex_new = bm.verts.new(vector_new)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            for f in bm.faces:
-                f.select_set(False)
-            for e in bm.edges:
-                e.select_set(False)
+            deselect_all(bm)
             vertex_new.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
+            update_edit_mesh(obj.data)
             bm.select_history.clear()
         elif operation in {"G", "V"}:
             vertex_new = None
@@ -423,35 +424,31 @@ def placement_intersect(context, operation):
                 else:
                     return
             bm.select_history.clear()
-            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+            moved = [vertex_a, vertex_b, vertex_c, vertex_d]
+            weld_vertices(bm, moved if vertex_new is None else moved + [vertex_new])
 
             if not process and not extend_all:
                 pg.error = PDT_ERR_INT_NO_ALL
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                bmesh.update_edit_mesh(obj.data)
+                show_message(context)
+                update_edit_mesh(obj.data)
                 return
-            for v in bm.verts:
-                v.select_set(False)
-            for f in bm.faces:
-                f.select_set(False)
-            for e in bm.edges:
-                e.select_set(False)
+            deselect_all(bm)
 
             if vertex_new is not None:
                 vertex_new.select_set(True)
             for v in bm.select_history:
                 if v is not None:
                     v.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
+            update_edit_mesh(obj.data)
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_INTERSECT}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_InvalidOperation
 
     elif obj.mode == "OBJECT":
         if len(context.view_layer.objects.selected) != 4:
             pg.error = f"{PDT_ERR_SEL_4_OBJS} {len(context.view_layer.objects.selected)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
         order = pg.object_order.split(",")
         objs = sorted(context.view_layer.objects.selected, key=lambda x: x.name)
@@ -465,7 +462,7 @@ def placement_intersect(context, operation):
             + ", "
             + objs[3].name
         )
-        context.window_manager.popup_menu(oops, title="Info", icon="INFO")
+        show_message(context, title="Info", icon="INFO")
 
         vector_a = objs[int(order[0]) - 1].matrix_world.decompose()[0]
         vector_b = objs[int(order[1]) - 1].matrix_world.decompose()[0]
@@ -474,7 +471,7 @@ def placement_intersect(context, operation):
         vector_delta, done = intersection(vector_a, vector_b, vector_c, vector_d, plane)
         if not done:
             pg.error = f"{PDT_ERR_INT_LINES} {plane}  {PDT_LAB_PLANE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_IntersectionError
         if operation == "C":
             scene.cursor.location = vector_delta
@@ -483,10 +480,10 @@ def placement_intersect(context, operation):
         elif operation == "G":
             context.view_layer.objects.active.location = vector_delta
             pg.error = f"{PDT_INF_OBJ_MOVED} {context.view_layer.objects.active.name}"
-            context.window_manager.popup_menu(oops, title="Info", icon="INFO")
+            show_message(context, title="Info", icon="INFO")
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_INTERSECT}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
         return
     else:
         return
@@ -512,24 +509,24 @@ def join_two_vertices(context):
     obj = context.view_layer.objects.active
     if all([bool(obj), obj.type == "MESH", obj.mode == "EDIT"]):
         bm = bmesh.from_edit_mesh(obj.data)
-        verts = [v for v in bm.verts if v.select]
+        verts = get_selection(bm).verts
         if len(verts) == 2:
             try:
                 bm.edges.new([verts[-1], verts[-2]])
-                bmesh.update_edit_mesh(obj.data)
+                update_edit_mesh(obj.data)
                 bm.select_history.clear()
                 return
             except ValueError:
                 pg.error = PDT_ERR_CONNECTED
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(context)
                 raise PDT_VerticesConnected
         else:
             pg.error = f"{PDT_ERR_SEL_2_VERTS} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         raise PDT_ObjectModeError
 
 
@@ -555,31 +552,31 @@ def set_angle_distance_two(context):
     obj = context.view_layer.objects.active
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
     if obj.mode == "EDIT":
         bm = bmesh.from_edit_mesh(obj.data)
-        verts = [v for v in bm.verts if v.select]
+        verts = get_selection(bm).verts
         if len(verts) == 2:
             if len(bm.select_history) == 2:
                 vector_a, vector_b = check_selection(2, bm, obj)
                 if vector_a is None:
                     pg.error = PDT_ERR_VERT_MODE
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                    show_message(context)
                     raise PDT_FeatureError
             else:
                 pg.error = f"{PDT_ERR_SEL_2_VERTIO} {len(bm.select_history)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(context)
                 raise PDT_SelectionError
         else:
             pg.error = f"{PDT_ERR_SEL_2_VERTIO} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
     elif obj.mode == "OBJECT":
         objs = context.view_layer.objects.selected
         if len(objs) < 2:
             pg.error = f"{PDT_ERR_SEL_2_OBJS} {len(objs)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
         objs_s = [ob for ob in objs if ob.name != obj.name]
         vector_a = obj.matrix_world.decompose()[0]
@@ -634,31 +631,31 @@ def set_angle_distance_three(context):
     obj = context.view_layer.objects.active
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         raise PDT_NoObjectError
     if obj.mode == "EDIT":
         bm = bmesh.from_edit_mesh(obj.data)
-        verts = [v for v in bm.verts if v.select]
+        verts = get_selection(bm).verts
         if len(verts) == 3:
             if len(bm.select_history) == 3:
                 vector_a, vector_b, vector_c = check_selection(3, bm, obj)
                 if vector_a is None:
                     pg.error = PDT_ERR_VERT_MODE
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                    show_message(context)
                     raise PDT_FeatureError
             else:
                 pg.error = f"{PDT_ERR_SEL_3_VERTIO} {len(bm.select_history)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(context)
                 raise PDT_SelectionError
         else:
             pg.error = f"{PDT_ERR_SEL_3_VERTIO} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
     elif obj.mode == "OBJECT":
         objs = context.view_layer.objects.selected
         if len(objs) < 3:
             pg.error = PDT_ERR_SEL_3_OBJS + str(len(objs))
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
         objs_s = [ob for ob in objs if ob.name != obj.name]
         vector_a = obj.matrix_world.decompose()[0]
@@ -684,13 +681,81 @@ def set_angle_distance_three(context):
     pg.cartesian_coords = Vector(([round(i, decimal_places) for i in vector_b - vector_a]))
 
 
+def mesh_users(meshes):
+    """Find the Objects that use each Mesh.
+
+    Args:
+        meshes: Collection of Mesh Data
+
+    Returns:
+        Dictionary of Mesh to List of Objects.
+    """
+
+    users = {mesh: [] for mesh in meshes}
+    for ob in bpy.data.objects:
+        if ob.data in users:
+            users[ob.data].append(ob)
+    return users
+
+
+def parent_depth(ob):
+    """Count the Parents above an Object.
+
+    Args:
+        ob: The Object
+
+    Returns:
+        Integer, 0 for an Object with no Parent.
+    """
+
+    depth = 0
+    while ob.parent is not None:
+        ob = ob.parent
+        depth += 1
+    return depth
+
+
+def shift_origins(offsets, users):
+    """Move the Objects using each Mesh by its Offset, keeping their Children in place.
+
+    Note:
+        Every World Matrix is read before any is set, then Objects are set
+        Parents first, Children that are not moved are set back to their World
+        Matrix, as Blender's own Set Origin does.
+
+    Args:
+        offsets: Dictionary of Mesh to Offset Vector in the Mesh's Space
+        users: Dictionary of Mesh to List of Objects, see mesh_users
+
+    Returns:
+        Nothing.
+    """
+
+    worlds = {}
+    pending = [ob for mesh in offsets for ob in users[mesh]]
+    while pending:
+        ob = pending.pop()
+        if ob not in worlds:
+            worlds[ob] = ob.matrix_world.copy()
+            pending.extend(ob.children)
+    for mesh, offset in offsets.items():
+        for ob in users[mesh]:
+            worlds[ob] = worlds[ob] @ Matrix.Translation(offset)
+    for ob in sorted(worlds, key=parent_depth):
+        ob.matrix_world = worlds[ob]
+
+
 def origin_to_cursor(context):
     """Sets Object Origin in Edit Mode to Cursor Location.
 
     Note:
         Keeps geometry static in World Space whilst moving Object Origin
         Requires cursor location
-        Works in Edit and Object Modes.
+        Works in Edit and Object Modes, in Object Mode on all Selected Objects.
+        Each Mesh, with its Shape Keys, is shifted once by one Matrix Translation,
+        every Object that uses it is moved to match, so Linked Duplicates and
+        Child Objects stay where they are. Objects with Zero Scale are skipped
+        and reported.
 
     Args:
         context: Blender bpy.context instance.
@@ -704,25 +769,45 @@ def origin_to_cursor(context):
     obj = context.view_layer.objects.active
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
-    obj_loc = obj.matrix_world.decompose()[0]
     cur_loc = scene.cursor.location
-    diff_v = obj_loc - cur_loc
     if obj.mode == "EDIT":
+        if obj.matrix_world.determinant() == 0.0:
+            pg.error = f"{PDT_ERR_FLATOBJ} {obj.name})"
+            show_message(context)
+            return
+        # Cursor Location in the Object's own Space
+        offset = obj.matrix_world.inverted() @ cur_loc
         bm = bmesh.from_edit_mesh(obj.data)
-        for v in bm.verts:
-            v.co = v.co + diff_v
-        obj.location = cur_loc
-        bmesh.update_edit_mesh(obj.data)
+        bmesh.ops.translate(bm, verts=bm.verts, vec=-offset)
+        shift_origins({obj.data: offset}, mesh_users([obj.data]))
+        update_edit_mesh(obj.data)
         bm.select_history.clear()
     elif obj.mode == "OBJECT":
-        for v in obj.data.vertices:
-            v.co = v.co + diff_v
-        obj.location = cur_loc
+        objs = [ob for ob in context.view_layer.objects.selected if ob.type == "MESH"]
+        if obj.type == "MESH" and obj not in objs:
+            objs.append(obj)
+        # All Offsets come from the World Matrices before any Object is moved
+        offsets = {}
+        flat = []
+        for ob in objs:
+            if ob.data in offsets:
+                continue
+            # Zero Scale Objects have no Local Space to put the Cursor in
+            if ob.matrix_world.determinant() == 0.0:
+                flat.append(ob.name)
+                continue
+            offsets[ob.data] = ob.matrix_world.inverted() @ cur_loc
+        for mesh, offset in offsets.items():
+            mesh.transform(Matrix.Translation(-offset), shape_keys=True)
+        shift_origins(offsets, mesh_users(offsets))
+        if flat:
+            pg.error = f"{PDT_ERR_FLATOBJ} {', '.join(flat)})"
+            show_message(context)
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE} {obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         raise PDT_ObjectModeError
 
 
@@ -753,36 +838,39 @@ def taper(context):
     if all([bool(obj), obj.type == "MESH", obj.mode == "EDIT"]):
         if ang_v > 80 or ang_v < -80:
             pg.error = f"{PDT_ERR_TAPER_ANG} {ang_v})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_InvalidAngle
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_NoObjectError
         _, a2, a3 = set_axis(tap_ax)
         bm = bmesh.from_edit_mesh(obj.data)
         if len(bm.select_history) >= 1:
             rotate_vertex = bm.select_history[-1]
-            view_vector = view_coords(rotate_vertex.co.x, rotate_vertex.co.y, rotate_vertex.co.z)
         else:
             pg.error = f"{PDT_ERR_TAPER_SEL} {len(bm.select_history)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             raise PDT_SelectionError
-        for v in [v for v in bm.verts if v.select]:
-            if pg.plane == "LO":
-                v_loc = view_coords(v.co.x, v.co.y, v.co.z)
-                dis_v = sqrt((view_vector.x - v_loc.x) ** 2 + (view_vector.y - v_loc.y) ** 2)
-                x_loc = dis_v * tan(ang_v * pi / 180)
-                view_matrix = view_dir(x_loc, 0)
-                v.co = v.co - view_matrix
-            else:
-                dis_v = sqrt(
-                    (rotate_vertex.co[a3] - v.co[a3]) ** 2 + (rotate_vertex.co[a2] - v.co[a2]) ** 2
-                )
-                v.co[a2] = v.co[a2] - (dis_v * tan(ang_v * pi / 180))
-        bmesh.update_edit_mesh(obj.data)
+        verts = get_selection(bm).verts
+        coords = np.array([v.co for v in verts], dtype=np.float64).reshape(-1, 3)
+        rotate_co = np.array(rotate_vertex.co)
+        tan_v = tan(ang_v * pi / 180)
+        if pg.plane == "LO":
+            # Distances are measured in the View, Vertices move along the View's X Axis
+            view_matrix = view_matrix_inverted()
+            view_locs = coords @ view_matrix.T
+            view_vector = view_matrix @ rotate_co
+            dis_v = np.hypot(view_vector[0] - view_locs[:, 0], view_vector[1] - view_locs[:, 1])
+            coords -= np.outer(dis_v * tan_v, view_matrix[:, 0])
+        else:
+            dis_v = np.hypot(rotate_co[a3] - coords[:, a3], rotate_co[a2] - coords[:, a2])
+            coords[:, a2] -= dis_v * tan_v
+        for v, co in zip(verts, coords.tolist()):
+            v.co = co
+        update_edit_mesh(obj.data)
         bm.select_history.clear()
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         raise PDT_ObjectModeError
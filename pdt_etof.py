@@ -32,7 +32,7 @@ from .pdt_msg_strings import (
     PDT_ERR_EDOB_MODE,
     PDT_ERR_SEL_1_E_1_F,
 )
-from .pdt_functions import oops
+from .pdt_functions import show_message, update_edit_mesh
 
 
 def failure_message(context):
@@ -47,7 +47,7 @@ def failure_message(context):
 
     pg = context.scene.pdt_pg
     pg.error = f"{PDT_ERR_SEL_1_E_1_F}"
-    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+    show_message(context)
 
 
 def failure_message_on_plane(context):
@@ -62,7 +62,7 @@ def failure_message_on_plane(context):
 
     pg = context.scene.pdt_pg
     pg.error = f"{PDT_ERR_NOINT}"
-    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+    show_message(context)
 
 def extend_vertex(context):
     """Computes Edge Extension to Face.
@@ -115,13 +115,13 @@ def extend_vertex(context):
 
             vertex_reference = v1_ref if (a_len < b_len) else v2_ref
             bm.edges.new([vertex_reference, new_vertex])
-            bmesh.update_edit_mesh(object_data, True)
+            update_edit_mesh(object_data, True)
 
         else:
             failure_message_on_plane(context)
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
 
 
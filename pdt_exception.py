@@ -24,64 +24,71 @@
 # Exceptions are used in the absence of nullable types in python
 
 
-class SelectionError(Exception):
+class PDTError(Exception):
+    """Base of all PDT Exceptions, catch this for any PDT Failure."""
+    pass
+
+
+class SelectionError(PDTError):
     """Selection Error Exception."""
     pass
 
 
-class InvalidVector(Exception):
+class InvalidVector(PDTError):
     """Invalid Vector Exception."""
     pass
 
 
-class CommandFailure(Exception):
+class CommandFailure(PDTError):
     """Command Failure Exception."""
     pass
 
 
-class ObjectModeError(Exception):
+class ObjectModeError(PDTError):
     """Object Mode Error Exception."""
     pass
 
 
-class MathsError(Exception):
+class MathsError(PDTError):
     """Mathematical Expression Error Exception."""
     pass
 
 
-class InfRadius(Exception):
+class InfRadius(PDTError):
     """Infinite Radius Error Exception."""
     pass
 
 
-class NoObjectError(Exception):
+class NoObjectError(PDTError):
     """No Active Object Exception."""
     pass
 
 
-class IntersectionError(Exception):
+class IntersectionError(PDTError):
     """Failure to Find Intersect Exception."""
     pass
 
 
-class InvalidOperation(Exception):
+class InvalidOperation(PDTError):
     """Invalid Operation Error Exception."""
     pass
 
 
-class VerticesConnected(Exception):
+class VerticesConnected(PDTError):
     """Vertices Already Connected Exception."""
     pass
 
 
-class InvalidAngle(Exception):
+class InvalidAngle(PDTError):
     """Angle Given was Outside Parameters Exception."""
     pass
 
-class ShaderError(Exception):
+
+class ShaderError(PDTError):
     """GL Shader Error Exception."""
     pass
 
-class FeatureError(Exception):
+
+class FeatureError(PDTError):
     """Wrong Feature Type Error Exception."""
     pass
@@ -29,6 +29,8 @@ import bgl
 import gpu
 import numpy as np
 from mathutils import Vector, Quaternion
+from mathutils.kdtree import KDTree
+from contextlib import contextmanager
 from gpu_extras.batch import batch_for_shader
 from math import cos, sin, pi
 from .pdt_msg_strings import (
@@ -39,6 +41,7 @@ from .pdt_msg_strings import (
     PDT_ERR_SEL_1_EDGEM,
 )
 from . import pdt_exception
+from . import pdt_geometry as geometry
 PDT_ShaderError = pdt_exception.ShaderError
 
 
@@ -88,6 +91,185 @@ def debug(msg, prefix=""):
         # laststack[0] is the caller's full file name, laststack[1] is the line number
         print(f"{prefix}{extract_filename(laststack[0])}:{laststack[1]}| {msg}")
 
+# Meshes waiting for update_edit_mesh while a Command Script runs, None otherwise
+_deferred_meshes = None
+
+
+def update_edit_mesh(mesh, loop_triangles=True):
+    """Update an Edit Mesh, or defer the update while a Command Script runs.
+
+    Args:
+        mesh: The Object's Mesh Data
+        loop_triangles: Recalculate Loop Triangles
+
+    Returns:
+        Nothing.
+    """
+
+    if _deferred_meshes is not None:
+        _deferred_meshes.add(mesh)
+    else:
+        bmesh.update_edit_mesh(mesh, loop_triangles)
+
+
+@contextmanager
+def deferred_mesh_updates():
+    """Hold back update_edit_mesh calls, then update each Mesh once at the end.
+
+    Returns:
+        Nothing.
+    """
+
+    global _deferred_meshes
+    if _deferred_meshes is not None:
+        # Already deferring, the outer session updates the Meshes
+        yield
+        return
+    _deferred_meshes = set()
+    try:
+        yield
+    finally:
+        meshes, _deferred_meshes = _deferred_meshes, None
+        for mesh in meshes:
+            bmesh.update_edit_mesh(mesh)
+
+
+# Selection Snapshots of each Bmesh while a Command runs, None otherwise
+_selections = None
+
+
+class Selection:
+    """Selected Vertices, Edges, Faces & Select History of a Bmesh.
+
+    Note:
+        Each kind of Element is read from the Bmesh the first time it is used,
+        then kept, so a Command scans the Mesh once rather than in every function.
+        Lists are the Selection as first read, update_sel drops the Snapshot.
+
+    Args:
+        bm: The object's Bmesh
+    """
+
+    def __init__(self, bm):
+        self.bm = bm
+        self._verts = None
+        self._edges = None
+        self._faces = None
+        self._history = None
+
+    @property
+    def verts(self):
+        """List of Selected Vertices."""
+        if self._verts is None:
+            self._verts = [v for v in self.bm.verts if v.select]
+        return self._verts
+
+    @property
+    def edges(self):
+        """List of Selected Edges."""
+        if self._edges is None:
+            self._edges = [e for e in self.bm.edges if e.select]
+        return self._edges
+
+    @property
+    def faces(self):
+        """List of Selected Faces."""
+        if self._faces is None:
+            self._faces = [f for f in self.bm.faces if f.select]
+        return self._faces
+
+    @property
+    def history(self):
+        """List of Select History Elements, oldest first."""
+        if self._history is None:
+            self._history = list(self.bm.select_history)
+        return self._history
+
+    @property
+    def geom(self):
+        """List of Selected Faces, Edges & Vertices, as used by bmesh.ops."""
+        return self.faces + self.edges + self.verts
+
+
+def get_selection(bm):
+    """Return the Selection Snapshot of a Bmesh for the running Command.
+
+    Args:
+        bm: The object's Bmesh
+
+    Returns:
+        Selection, a new one if no Command is running.
+    """
+
+    if _selections is None:
+        return Selection(bm)
+    selection = _selections.get(bm)
+    if selection is None:
+        selection = _selections[bm] = Selection(bm)
+    return selection
+
+
+@contextmanager
+def selection_snapshot():
+    """Share one Selection Snapshot per Bmesh while a Command runs.
+
+    Returns:
+        Nothing.
+    """
+
+    global _selections
+    outer, _selections = _selections, {}
+    try:
+        yield
+    finally:
+        _selections = outer
+
+
+# Messages collected by pdt_api while Commands run without the UI, None otherwise
+_collected_messages = None
+
+
+def show_message(context, title="Error", icon="ERROR"):
+    """Report the Message held in pg.error.
+
+    Note:
+        The Message is shown in a Popup from the UI, collected while Commands
+        run through pdt_api and printed when Blender runs in the background.
+
+    Args:
+        context: Blender bpy.context instance.
+        title: Popup Title
+        icon: Popup Icon, "ERROR" marks the Message as an Error
+
+    Returns:
+        Nothing.
+    """
+
+    message = context.scene.pdt_pg.error
+    if _collected_messages is not None:
+        _collected_messages.append((icon, message))
+    elif bpy.app.background:
+        print(f"PDT {title}: {message}")
+    else:
+        context.window_manager.popup_menu(oops, title=title, icon=icon)
+
+
+@contextmanager
+def collected_messages():
+    """Collect show_message reports instead of showing Popups.
+
+    Returns:
+        List of (icon, message) Tuples, filled as Messages are reported.
+    """
+
+    global _collected_messages
+    outer, _collected_messages = _collected_messages, []
+    try:
+        yield _collected_messages
+    finally:
+        _collected_messages = outer
+
+
 def oops(self, context):
     """Error Routine.
 
@@ -190,17 +372,49 @@ def check_selection(num, bm, obj):
             vector_d = bm.select_history[-4].co
             return vector_a, vector_b, vector_c, vector_d
     else:
-        for f in bm.faces:
-            f.select_set(False)
-        for e in bm.edges:
-            e.select_set(False)
-        for v in bm.verts:
-            v.select_set(False)
-        bmesh.update_edit_mesh(obj.data)
+        deselect_all(bm)
+        update_edit_mesh(obj.data)
         bm.select_history.clear()
     return None
 
 
+def set_locations(objects, location):
+    """Set the Location of many Objects in one call.
+
+    Args:
+        objects: Collection of Objects, e.g. view_layer.objects.selected
+        location: The new Location Vector
+
+    Returns:
+        Nothing.
+    """
+
+    locations = np.tile(np.array(location, dtype=np.float32), len(objects))
+    objects.foreach_set("location", locations)
+
+
+def deselect_all(bm):
+    """Clear the Selection of a Bmesh, touching only Selected Elements.
+
+    Note:
+        Selected Elements come from the Command's Selection Snapshot, so the cost
+        follows the size of the Selection, not the Mesh. Select flags are cleared
+        directly, as nothing is left selected there is nothing to flush.
+
+    Args:
+        bm: Object Bmesh
+
+    Returns:
+        Nothing.
+    """
+
+    for element in get_selection(bm).geom:
+        if element.is_valid:
+            element.select = False
+    if _selections is not None:
+        _selections.pop(bm, None)
+
+
 def update_sel(bm, verts, edges, faces):
     """Updates Vertex, Edge and Face Selections following a function.
 
@@ -213,12 +427,7 @@ def update_sel(bm, verts, edges, faces):
     Returns:
         Nothing.
     """
-    for f in bm.faces:
-        f.select_set(False)
-    for e in bm.edges:
-        e.select_set(False)
-    for v in bm.verts:
-        v.select_set(False)
+    deselect_all(bm)
     for v in verts:
         v.select_set(True)
     for e in edges:
@@ -227,6 +436,199 @@ def update_sel(bm, verts, edges, faces):
         f.select_set(True)
 
 
+def weld_vertices(bm, verts, dist=0.0001, neighbours=True):
+    """Merge Vertices closer than dist, only around the given Vertices.
+
+    Note:
+        Replaces bmesh.ops.remove_doubles over the whole Mesh after a small edit.
+        The given Vertices, their Edge Neighbours & the Vertices of every Face
+        joined to either are put in a KDTree, so the cost follows the size of
+        the edit, not of the Mesh. Vertices away from the edit are not merged.
+
+    Args:
+        bm: The object's Bmesh
+        verts: Vertices made or moved by the edit
+        dist: Merge Distance
+        neighbours: Also merge onto nearby Vertices, else only among verts, as
+            remove_doubles with verts set to the Selection
+
+    Returns:
+        Nothing.
+    """
+
+    verts = [v for v in dict.fromkeys(verts) if v.is_valid]
+    candidates = dict.fromkeys(verts)
+    if neighbours:
+        ring = dict.fromkeys(verts)
+        for vert in verts:
+            for edge in vert.link_edges:
+                ring[edge.other_vert(vert)] = None
+        candidates.update(ring)
+        for vert in ring:
+            for face in vert.link_faces:
+                candidates.update(dict.fromkeys(face.verts))
+    candidates = list(candidates)
+    if len(candidates) < 2:
+        return
+
+    tree = KDTree(len(candidates))
+    for index, vert in enumerate(candidates):
+        tree.insert(vert.co, index)
+    tree.balance()
+
+    # Join Vertices in range into groups, each is welded to its first Vertex
+    parent = {}
+
+    def group(vert):
+        while vert in parent:
+            vert = parent[vert]
+        return vert
+
+    for vert in verts:
+        for _co, index, _distance in tree.find_range(vert.co, dist):
+            group_a, group_b = group(vert), group(candidates[index])
+            if group_a is not group_b:
+                parent[group_b] = group_a
+    if parent:
+        bmesh.ops.weld_verts(bm, targetmap={vert: group(vert) for vert in parent})
+
+
+# Temporary Vertex Layer numbering the Vertices added by new_vertices_from_array
+ARRAY_LAYER = "PDT_Array"
+
+
+def new_vertices_from_array(bm, coords, connect=False, start_vertex=None):
+    """Add Vertices, optionally joined as a Polyline, to a Bmesh in one batch.
+
+    Note:
+        The Vertices are written to a temporary Mesh with foreach_set, then
+        appended to the Bmesh, instead of calling bm.verts.new for each one.
+        New Vertices are selected, existing selection is left as it is.
+        from_mesh may reuse the places of deleted Vertices, so the new ones are
+        found by their number in a temporary Integer Layer, not by position.
+
+    Args:
+        bm: The object's Bmesh
+        coords: Float Array (N, 3) of Local Coordinates
+        connect: Join the new Vertices in order with Edges
+        start_vertex: Optional existing Vertex joined to the first new Vertex
+
+    Returns:
+        List of new Vertices.
+    """
+
+    coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+    count = len(coords)
+    mesh = bpy.data.meshes.new("PDT_Array")
+    try:
+        mesh.vertices.add(count)
+        mesh.vertices.foreach_set("co", coords.ravel())
+        mesh.vertices.foreach_set("select", np.ones(count, dtype=bool))
+        if connect and count > 1:
+            mesh.edges.add(count - 1)
+            index = np.arange(count - 1, dtype=np.int32)
+            mesh.edges.foreach_set("vertices", np.column_stack((index, index + 1)).ravel())
+            mesh.edges.foreach_set("select", np.ones(count - 1, dtype=bool))
+        # Numbers from 1, existing Vertices get 0 in the Bmesh
+        layer = mesh.vertex_layers_int.new(name=ARRAY_LAYER)
+        layer.data.foreach_set("value", np.arange(1, count + 1, dtype=np.int32))
+        bm.from_mesh(mesh)
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+    layer = bm.verts.layers.int[ARRAY_LAYER]
+    new_verts = [None] * count
+    for vert in bm.verts:
+        number = vert[layer]
+        if number:
+            new_verts[number - 1] = vert
+    bm.verts.layers.int.remove(layer)
+    if start_vertex is not None and new_verts:
+        bm.edges.new((start_vertex, new_verts[0])).select_set(True)
+    return new_verts
+
+
+# View Transform of the last 3D View used, see get_view_transform
+_view_transform = None
+
+
+class ViewTransform:
+    """Rotation of a 3D View and its Inverse, made from the View Matrix.
+
+    Note:
+        Only the Region's pointer is kept, so a closed 3D View is never touched.
+
+    Args:
+        region_3d: The 3D View's RegionView3D
+    """
+
+    def __init__(self, region_3d):
+        self.pointer = region_3d.as_pointer()
+        self.view_matrix = region_3d.view_matrix.copy()
+        self.matrix = self.view_matrix.to_3x3().normalized()
+        self.matrix_inverted = self.matrix.inverted()
+
+
+def view_region_3d():
+    """Find the 3D View Region for View Oriented Operations.
+
+    Note:
+        The 3D View the Operator was invoked from, else the first 3D View on
+        the Screen, as PDT has always used.
+
+    Returns:
+        RegionView3D, or None if there is no 3D View.
+    """
+
+    space = getattr(bpy.context, "space_data", None)
+    if space is not None and space.type == "VIEW_3D":
+        return space.region_3d
+    screen = bpy.context.screen
+    if screen is None:
+        return None
+    areas = [a for a in screen.areas if a.type == "VIEW_3D"]
+    if len(areas) > 0:
+        return areas[0].spaces.active.region_3d
+    return None
+
+
+def get_view_transform():
+    """Return the View Transform, made again only if the View has changed.
+
+    Returns:
+        ViewTransform, or None if there is no 3D View.
+    """
+
+    global _view_transform
+    region_3d = view_region_3d()
+    if region_3d is None:
+        return None
+    view = _view_transform
+    if (
+        view is None
+        or view.pointer != region_3d.as_pointer()
+        or view.view_matrix != region_3d.view_matrix
+    ):
+        view = _view_transform = ViewTransform(region_3d)
+    return view
+
+
+def view_matrix_inverted():
+    """Return the View's Inverted Rotation Matrix, as used by view_coords & view_dir.
+
+    Note:
+        For callers that convert many Vectors with Numpy.
+
+    Returns:
+        Float Array (3, 3), all 0 if there is no 3D View.
+    """
+
+    view = get_view_transform()
+    if view is None:
+        return np.zeros((3, 3))
+    return np.array(view.matrix_inverted)
+
+
 def view_coords(x_loc, y_loc, z_loc):
     """Converts input Vector values to new Screen Oriented Vector.
 
@@ -239,12 +641,10 @@ def view_coords(x_loc, y_loc, z_loc):
         Vector adjusted to View's Inverted Tranformation Matrix.
     """
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        view_matrix = areas[0].spaces.active.region_3d.view_matrix
-        view_matrix = view_matrix.to_3x3().normalized().inverted()
+    view = get_view_transform()
+    if view is not None:
         view_location = Vector((x_loc, y_loc, z_loc))
-        new_view_location = view_matrix @ view_location
+        new_view_location = view.matrix_inverted @ view_location
         return new_view_location
 
     return Vector((0, 0, 0))
@@ -265,12 +665,10 @@ def view_coords_i(x_loc, y_loc, z_loc):
         Vector adjusted to View's Transformation Matrix.
     """
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        view_matrix = areas[0].spaces.active.region_3d.view_matrix
-        view_matrix = view_matrix.to_3x3().normalized()
+    view = get_view_transform()
+    if view is not None:
         view_location = Vector((x_loc, y_loc, z_loc))
-        new_view_location = view_matrix @ view_location
+        new_view_location = view.matrix @ view_location
         return new_view_location
 
     return Vector((0, 0, 0))
@@ -291,14 +689,12 @@ def view_dir(dis_v, ang_v):
         World Vector.
     """
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        view_matrix = areas[0].spaces.active.region_3d.view_matrix
-        view_matrix = view_matrix.to_3x3().normalized().inverted()
+    view = get_view_transform()
+    if view is not None:
         view_location = Vector((0, 0, 0))
         view_location.x = dis_v * cos(ang_v * pi / 180)
         view_location.y = dis_v * sin(ang_v * pi / 180)
-        new_view_location = view_matrix @ view_location
+        new_view_location = view.matrix_inverted @ view_location
         return new_view_location
 
     return Vector((0, 0, 0))
@@ -341,29 +737,8 @@ def arc_centre(vector_a, vector_b, vector_c):
         Vector representing Arc Centre and Float representing Arc Radius.
     """
 
-    coord_a = np.array([vector_a.x, vector_a.y, vector_a.z])
-    coord_b = np.array([vector_b.x, vector_b.y, vector_b.z])
-    coord_c = np.array([vector_c.x, vector_c.y, vector_c.z])
-    line_a = np.linalg.norm(coord_c - coord_b)
-    line_b = np.linalg.norm(coord_c - coord_a)
-    line_c = np.linalg.norm(coord_b - coord_a)
-    # fmt: off
-    line_s = (line_a+line_b+line_c) / 2
-    radius = (
-        line_a*line_b*line_c/4
-        / np.sqrt(line_s
-                  * (line_s-line_a)
-                  * (line_s-line_b)
-                  * (line_s-line_c))
-        )
-    base_1 = line_a*line_a * (line_b*line_b + line_c*line_c - line_a*line_a)
-    base_2 = line_b*line_b * (line_a*line_a + line_c*line_c - line_b*line_b)
-    base_3 = line_c*line_c * (line_a*line_a + line_b*line_b - line_c*line_c)
-    # fmt: on
-    intersect_coord = np.column_stack((coord_a, coord_b, coord_c))
-    intersect_coord = intersect_coord.dot(np.hstack((base_1, base_2, base_3)))
-    intersect_coord /= base_1 + base_2 + base_3
-    return Vector((intersect_coord[0], intersect_coord[1], intersect_coord[2])), radius
+    centre, radius = geometry.arc_centre(vector_a, vector_b, vector_c)
+    return Vector((centre[0], centre[1], centre[2])), radius
 
 
 def intersection(vertex_a, vertex_b, vertex_c, vertex_d, plane):
@@ -402,15 +777,10 @@ def intersection(vertex_a, vertex_b, vertex_c, vertex_d, plane):
         coord_b = (vertex_d[a1], vertex_d[a2])
         coord_c = (vertex_a[a1], vertex_a[a2])
         coord_d = (vertex_b[a1], vertex_b[a2])
-    v_stack = np.vstack([coord_a, coord_b, coord_c, coord_d])
-    h_stack = np.hstack((v_stack, np.ones((4, 1))))
-    line_a = np.cross(h_stack[0], h_stack[1])
-    line_b = np.cross(h_stack[2], h_stack[3])
-    x_loc, y_loc, z_loc = np.cross(line_a, line_b)
-    if z_loc == 0:
+    crossing = geometry.line_intersection_2d(coord_a, coord_b, coord_c, coord_d)
+    if crossing is None:
         return Vector((0, 0, 0)), False
-    new_x_loc = x_loc / z_loc
-    new_z_loc = y_loc / z_loc
+    new_x_loc, new_z_loc = crossing
     if plane == "LO":
         new_y_loc = 0
     else:
@@ -453,17 +823,17 @@ def get_percent(obj, flip_percent, per_v, data, scene):
 
     if obj.mode == "EDIT":
         bm = bmesh.from_edit_mesh(obj.data)
-        verts = [v for v in bm.verts if v.select]
+        verts = get_selection(bm).verts
         if len(verts) == 2:
             vector_a = verts[0].co
             vector_b = verts[1].co
             if vector_a is None:
                 pg.error = PDT_ERR_VERT_MODE
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(bpy.context)
                 return None
         else:
             pg.error = PDT_ERR_SEL_2_V_1_E + str(len(verts)) + " Vertices"
-            bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(bpy.context)
             return None
         coord_a = np.array([vector_a.x, vector_a.y, vector_a.z])
         coord_b = np.array([vector_b.x, vector_b.y, vector_b.z])
@@ -471,7 +841,7 @@ def get_percent(obj, flip_percent, per_v, data, scene):
         objs = bpy.context.view_layer.objects.selected
         if len(objs) != 2:
             pg.error = PDT_ERR_SEL_2_OBJS + str(len(objs)) + ")"
-            bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(bpy.context)
             return None
         coord_a = np.array(
             [
@@ -487,12 +857,10 @@ def get_percent(obj, flip_percent, per_v, data, scene):
                 objs[-2].matrix_world.decompose()[0].z,
             ]
         )
-    coord_c = coord_b - coord_a
-    coord_d = np.array([0, 0, 0])
     _per_v = per_v
     if (flip_percent and data != "MV") or data == "MV":
         _per_v = 100 - per_v
-    coord_out = (coord_d+coord_c) * (_per_v / 100) + coord_a
+    coord_out = geometry.percent_point(coord_a, coord_b, _per_v)
     return Vector((coord_out[0], coord_out[1], coord_out[2]))
 
 
@@ -514,14 +882,14 @@ def obj_check(obj, scene, operation):
 
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(bpy.context)
         return None, False
     if obj.mode == "EDIT":
         bm = bmesh.from_edit_mesh(obj.data)
         if _operation == "S":
             if len(bm.edges) < 1:
                 pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(bm.edges)})"
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(bpy.context)
                 return None, False
             return bm, True
         if len(bm.select_history) >= 1:
@@ -529,12 +897,12 @@ def obj_check(obj, scene, operation):
             if _operation not in {"D", "E", "F", "G", "N", "S"}:
                 vector_a = check_selection(1, bm, obj)
             else:
-                verts = [v for v in bm.verts if v.select]
+                verts = get_selection(bm).verts
                 if len(verts) > 0:
                     vector_a = verts[0]
             if vector_a is None:
                 pg.error = PDT_ERR_VERT_MODE
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                show_message(bpy.context)
                 return None, False
         return bm, True
     return None, True
@@ -0,0 +1,633 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+#
+# <pep8 compliant>
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Geometry Core, plain Numpy routines used by PDT Operations.
+#
+# This module must not import bpy, bmesh, gpu, bgl or mathutils, nor use
+# relative imports, so it can be loaded, tested and profiled outside Blender.
+#
+import heapq
+import numpy as np
+from collections import defaultdict
+from math import hypot
+
+
+def arc_centre(coord_a, coord_b, coord_c):
+    """Calculates Centre of Arc through 3 Coordinates.
+
+    Args:
+        coord_a: Float Array (3) of First Location
+        coord_b: Float Array (3) of Second Location
+        coord_c: Float Array (3) of Third Location
+
+    Returns:
+        Float Array (3) of Arc Centre and Float of Arc Radius.
+    """
+
+    coord_a, coord_b, coord_c = (np.asarray(co, dtype=np.float64) for co in (coord_a, coord_b, coord_c))
+    line_a = np.linalg.norm(coord_c - coord_b)
+    line_b = np.linalg.norm(coord_c - coord_a)
+    line_c = np.linalg.norm(coord_b - coord_a)
+    # fmt: off
+    line_s = (line_a+line_b+line_c) / 2
+    radius = (
+        line_a*line_b*line_c/4
+        / np.sqrt(line_s
+                  * (line_s-line_a)
+                  * (line_s-line_b)
+                  * (line_s-line_c))
+        )
+    base_1 = line_a*line_a * (line_b*line_b + line_c*line_c - line_a*line_a)
+    base_2 = line_b*line_b * (line_a*line_a + line_c*line_c - line_b*line_b)
+    base_3 = line_c*line_c * (line_a*line_a + line_b*line_b - line_c*line_c)
+    # fmt: on
+    intersect_coord = np.column_stack((coord_a, coord_b, coord_c))
+    intersect_coord = intersect_coord.dot(np.hstack((base_1, base_2, base_3)))
+    intersect_coord /= base_1 + base_2 + base_3
+    return intersect_coord, radius
+
+
+def line_intersection_2d(coord_a, coord_b, coord_c, coord_d):
+    """Calculates Intersection of 2 Imagined Lines in a Plane.
+
+    Args:
+        coord_a, coord_b: 2 Points (x, y) on the First Line
+        coord_c, coord_d: 2 Points (x, y) on the Second Line
+
+    Returns:
+        Tuple (x, y) of the Intersection, None if the Lines are Parallel.
+    """
+
+    v_stack = np.vstack([coord_a, coord_b, coord_c, coord_d])
+    h_stack = np.hstack((v_stack, np.ones((4, 1))))
+    line_a = np.cross(h_stack[0], h_stack[1])
+    line_b = np.cross(h_stack[2], h_stack[3])
+    x_loc, y_loc, z_loc = np.cross(line_a, line_b)
+    if z_loc == 0:
+        return None
+    return x_loc / z_loc, y_loc / z_loc
+
+
+def percent_point(coord_a, coord_b, percent):
+    """Calculates a Point a Percentage of the way from one Coordinate to another.
+
+    Args:
+        coord_a: Float Array (3) of Start Location
+        coord_b: Float Array (3) of End Location
+        percent: Percentage of the Distance from coord_a
+
+    Returns:
+        Float Array (3).
+    """
+
+    coord_a = np.asarray(coord_a, dtype=np.float64)
+    return (np.asarray(coord_b, dtype=np.float64) - coord_a) * (percent / 100) + coord_a
+
+
+def line_line_closest(coord_a, coord_b, coord_c, coord_d, epsilon=1.0e-6):
+    """Find the Closest Points of 2 Lines, plain form of intersect_line_line.
+
+    Args:
+        coord_a, coord_b: Float Arrays (3) of 2 Points on the First Line
+        coord_c, coord_d: Float Arrays (3) of 2 Points on the Second Line
+        epsilon: Gap below which the Lines are taken to meet
+
+    Returns:
+        2 Float Arrays (3), closest Points on each Line, None if the Lines are Parallel.
+    """
+
+    coord_a, coord_b, coord_c, coord_d = (
+        np.asarray(co, dtype=np.float64) for co in (coord_a, coord_b, coord_c, coord_d)
+    )
+    vector_a = coord_b - coord_a
+    vector_b = coord_d - coord_c
+    vector_c = coord_c - coord_a
+    normal = np.cross(vector_a, vector_b)
+    divisor = normal.dot(normal)
+    if divisor == 0.0:
+        return None
+    gap = vector_c.dot(normal)
+    if abs(gap) > epsilon:
+        # Skew lines, move the second line onto the plane of the first
+        offset = normal * (-gap / divisor)
+        point_a = coord_a + vector_a * (np.cross(vector_c + offset, vector_b).dot(normal) / divisor)
+        return point_a, point_a - offset
+    point_a = coord_a + vector_a * (np.cross(vector_c, vector_b).dot(normal) / divisor)
+    return point_a, point_a.copy()
+
+
+def point_line_closest(point, coord_a, coord_b):
+    """Find the Closest Point on a Line, plain form of intersect_point_line.
+
+    Args:
+        point: Float Array (3) of the Point
+        coord_a, coord_b: Float Arrays (3) of 2 Points on the Line
+
+    Returns:
+        Float Array (3) of Closest Point and Float Parameter along the Line.
+    """
+
+    point, coord_a, coord_b = (np.asarray(co, dtype=np.float64) for co in (point, coord_a, coord_b))
+    direction = coord_b - coord_a
+    length_sq = direction.dot(direction)
+    param = 0.0 if length_sq == 0.0 else float((point - coord_a).dot(direction) / length_sq)
+    return coord_a + direction * param, param
+
+
+def point_on_edge(point, edge, tolerance=1.0e-5):
+    """Check if a Point lies on an Edge.
+
+    Args:
+        point: Float Array (3) of the Point
+        edge: 2 Float Arrays (3) of Edge End Coordinates
+        tolerance: Maximum distance of the Point from the Edge
+
+    Returns:
+        Boolean.
+    """
+
+    closest, param = point_line_closest(point, *edge)
+    on_line = np.linalg.norm(closest - np.asarray(point, dtype=np.float64)) < tolerance
+    return bool(on_line and 0.0 <= param <= 1.0)
+
+
+def edge_key(coords):
+    """Return a Key for an Edge that does not depend on its Index or Direction.
+
+    Args:
+        coords: Array (2, 3) of Edge End Coordinates
+
+    Returns:
+        Tuple of two Coordinate Tuples.
+    """
+
+    start, end = np.asarray(coords).tolist()
+    return (tuple(start), tuple(end)) if start <= end else (tuple(end), tuple(start))
+
+
+def pairs_share_vertex(edge_verts, pairs):
+    """Check which Pairs of Edges share a Vertex.
+
+    Args:
+        edge_verts: Integer Array (N, 2) of Edge Vertex Indices
+        pairs: Integer Array (P, 2) of Rows into edge_verts
+
+    Returns:
+        Boolean Array (P).
+    """
+
+    verts_a = edge_verts[pairs[:, 0]]
+    verts_b = edge_verts[pairs[:, 1]]
+    return (verts_a[:, :, None] == verts_b[:, None, :]).any(axis=(1, 2))
+
+
+def grid_span(mins, maxs, cell_size):
+    """Return the Uniform Grid Cells covered by Bounding Boxes.
+
+    Args:
+        mins: Float Array (N, 3) of Box Minimum Corners
+        maxs: Float Array (N, 3) of Box Maximum Corners
+        cell_size: Edge Length of a Grid Cell
+
+    Returns:
+        Integer Arrays (N, 3) of Lowest Cell and Number of Cells per Axis.
+    """
+
+    low = np.floor(mins / cell_size).astype(np.int64)
+    span = np.floor(maxs / cell_size).astype(np.int64) - low + 1
+    return low, span
+
+
+def grid_cell_size(mins, maxs):
+    """Choose a Uniform Grid Cell Size for a set of Bounding Boxes.
+
+    Note:
+        Cells are sized from the average box, then grown if long edges
+        would cover too many cells.
+
+    Args:
+        mins: Float Array (N, 3) of Box Minimum Corners
+        maxs: Float Array (N, 3) of Box Maximum Corners
+
+    Returns:
+        Edge Length of a Grid Cell.
+    """
+
+    cell_size = float((maxs - mins).max(axis=1).mean())
+    while grid_span(mins, maxs, cell_size)[1].prod(axis=1).sum() > 8 * len(mins):
+        cell_size *= 2.0
+    return cell_size
+
+
+def grid_cells(mins, maxs, cell_size):
+    """Expand Bounding Boxes into the Uniform Grid Cells they cover.
+
+    Args:
+        mins: Float Array (N, 3) of Box Minimum Corners
+        maxs: Float Array (N, 3) of Box Maximum Corners
+        cell_size: Edge Length of a Grid Cell
+
+    Returns:
+        Integer Array of Box Rows and Integer Array (M, 3) of Cell Coordinates.
+    """
+
+    low, span = grid_span(mins, maxs, cell_size)
+    counts = span.prod(axis=1)
+    rows = np.repeat(np.arange(len(mins)), counts)
+    # Position of each expanded row within its own box, unravelled over the box span
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    span_rows = span[rows]
+    cells = np.empty((len(rows), 3), dtype=np.int64)
+    cells[:, 0] = local % span_rows[:, 0]
+    cells[:, 1] = (local // span_rows[:, 0]) % span_rows[:, 1]
+    cells[:, 2] = local // (span_rows[:, 0] * span_rows[:, 1])
+    return rows, cells + low[rows]
+
+
+def broad_phase_pairs(edge_coords, tolerance=1.0e-5):
+    """Find Pairs of Edges whose Bounding Boxes overlap.
+
+    Note:
+        Boxes are padded by tolerance, so every pair of edges that can pass the
+        1.0e-5 intersection tests is returned. Edges are bucketed in a uniform
+        grid, only edges sharing a grid cell are compared.
+
+    Args:
+        edge_coords: Float Array (N, 2, 3) of Edge End Coordinates
+        tolerance: Padding added to each Bounding Box
+
+    Returns:
+        Integer Array (P, 2) of Row Pairs (lower row first), sorted.
+    """
+
+    num_edges = len(edge_coords)
+    if num_edges < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    mins = edge_coords.min(axis=1) - tolerance
+    maxs = edge_coords.max(axis=1) + tolerance
+
+    cell_size = grid_cell_size(mins, maxs)
+    rows, cells = grid_cells(mins, maxs, cell_size)
+
+    _, cell_ids = np.unique(cells, axis=0, return_inverse=True)
+    order = np.argsort(cell_ids.ravel(), kind="stable")
+    rows = rows[order]
+    cell_ids = cell_ids.ravel()[order]
+
+    # Pair every entry with the entries following it in the same cell
+    num_rows = len(rows)
+    starts = np.flatnonzero(np.r_[True, cell_ids[1:] != cell_ids[:-1]])
+    ends = np.repeat(np.r_[starts[1:], num_rows], np.diff(np.r_[starts, num_rows]))
+    partners = ends - np.arange(num_rows) - 1
+    first = np.repeat(np.arange(num_rows), partners)
+    second = (
+        first + 1
+        + np.arange(len(first))
+        - np.repeat(np.cumsum(partners) - partners, partners)
+    )
+    row_a = np.minimum(rows[first], rows[second])
+    row_b = np.maximum(rows[first], rows[second])
+    keys = np.unique(row_a * num_edges + row_b)
+    row_a = keys // num_edges
+    row_b = keys % num_edges
+
+    # Exact box overlap test on the surviving candidates
+    overlap = np.all(
+        (mins[row_a] <= maxs[row_b]) & (mins[row_b] <= maxs[row_a]), axis=1
+    )
+    return np.column_stack((row_a[overlap], row_b[overlap]))
+
+
+def point_params_on_edges(points, edges, tolerance=1.0e-5):
+    """Find Parameters of Points along their paired Edges.
+
+    Note:
+        Vectorised form of point_on_edge, with the same tolerance.
+
+    Args:
+        points: Float Array (M, 3) of Points
+        edges: Float Array (M, 2, 3) of End Coordinates of the Edge paired with each Point
+        tolerance: Maximum distance of a Point from its Edge
+
+    Returns:
+        Float Array (M,) of Parameters along each Edge,
+        Boolean Array (M,) of Points lying on their Edge.
+    """
+
+    direction = edges[:, 1] - edges[:, 0]
+    length_sq = np.einsum("ij,ij->i", direction, direction)
+    param = np.einsum("ij,ij->i", points - edges[:, 0], direction)
+    param = np.divide(param, length_sq, out=np.zeros_like(param), where=length_sq != 0)
+    closest = edges[:, 0] + param[:, None] * direction
+    on_line = np.linalg.norm(closest - points, axis=1) < tolerance
+    return param, on_line & (param >= 0.0) & (param <= 1.0)
+
+
+def points_on_edges(points, edges, tolerance=1.0e-5):
+    """Check which Points lie on their paired Edges, batch version of point_on_edge.
+
+    Args:
+        points: Float Array (M, 3) of Points
+        edges: Float Array (M, 2, 3) of End Coordinates of the Edge paired with each Point
+        tolerance: Maximum distance of a Point from its Edge
+
+    Returns:
+        Boolean Array (M,).
+    """
+
+    return point_params_on_edges(points, edges, tolerance)[1]
+
+
+def num_edges_points_lie_on(points, edges, tolerance=1.0e-5):
+    """Count the Edges of a Pair each Point lies on, batch version of num_edges_point_lies_on.
+
+    Args:
+        points: Float Array (M, 3) of Points
+        edges: Float Array (M, 4, 3) of End Coordinates of the Edge Pair for each Point
+        tolerance: Maximum distance of a Point from an Edge
+
+    Returns:
+        Integer Array (M,) of 0, 1 or 2.
+    """
+
+    edges = edges.reshape(-1, 2, 2, 3)
+    on_first = points_on_edges(points, edges[:, 0], tolerance)
+    on_second = points_on_edges(points, edges[:, 1], tolerance)
+    return on_first.astype(np.int64) + on_second
+
+
+def point_edge_pairs(points, edge_coords, tolerance=1.0e-5):
+    """Find every Edge each Point lies on.
+
+    Note:
+        Edges are bucketed in a uniform grid by their padded bounding boxes,
+        each Point is only tested against the Edges in its own cell.
+
+    Args:
+        points: Float Array (M, 3) of Points
+        edge_coords: Float Array (N, 2, 3) of Edge End Coordinates
+        tolerance: Maximum distance of a Point from an Edge
+
+    Returns:
+        Integer Array (K, 2) of Point Rows and Edge Rows, sorted.
+    """
+
+    if not len(points) or not len(edge_coords):
+        return np.empty((0, 2), dtype=np.int64)
+    mins = edge_coords.min(axis=1) - tolerance
+    maxs = edge_coords.max(axis=1) + tolerance
+    cell_size = grid_cell_size(mins, maxs)
+    edge_rows, edge_cells = grid_cells(mins, maxs, cell_size)
+    point_cells = np.floor(points / cell_size).astype(np.int64)
+
+    _, cell_ids = np.unique(
+        np.concatenate((edge_cells, point_cells)), axis=0, return_inverse=True
+    )
+    cell_ids = cell_ids.ravel()
+    edge_ids = cell_ids[:len(edge_cells)]
+    point_ids = cell_ids[len(edge_cells):]
+    order = np.argsort(edge_ids, kind="stable")
+    edge_ids = edge_ids[order]
+    edge_rows = edge_rows[order]
+
+    # Pair each Point with every Edge entry in its cell
+    starts = np.searchsorted(edge_ids, point_ids, side="left")
+    counts = np.searchsorted(edge_ids, point_ids, side="right") - starts
+    point_rows = np.repeat(np.arange(len(points)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    candidates = edge_rows[np.repeat(starts, counts) + local]
+
+    on_edge = points_on_edges(points[point_rows], edge_coords[candidates], tolerance)
+    pairs = np.column_stack((point_rows[on_edge], candidates[on_edge]))
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def count_edges_points_lie_on(points, edge_coords, tolerance=1.0e-5):
+    """Count the Edges each Point lies on.
+
+    Args:
+        points: Float Array (M, 3) of Points
+        edge_coords: Float Array (N, 2, 3) of Edge End Coordinates
+        tolerance: Maximum distance of a Point from an Edge
+
+    Returns:
+        Integer Array (M,).
+    """
+
+    pairs = point_edge_pairs(points, edge_coords, tolerance)
+    return np.bincount(pairs[:, 0], minlength=len(points))
+
+
+def intersect_edges_batch(edges_a, edges_b, tolerance=1.0e-5):
+    """Intersect Many Pairs of Edges in one Pass.
+
+    Note:
+        Vectorised form of intersect_line_line followed by the point_on_edge
+        tests used by Intersect All, with the same tolerances.
+
+    Args:
+        edges_a: Float Array (N, 2, 3) of First Edge End Coordinates
+        edges_b: Float Array (N, 2, 3) of Second Edge End Coordinates
+        tolerance: Maximum gap between the lines and distance off each edge
+
+    Returns:
+        Float Array (N, 3) of Intersection Points (closest point on first edge),
+        Float Arrays (N,) of Parameters along first and second Edges,
+        Boolean Array (N,) of Valid Intersections.
+    """
+
+    vector_a = edges_a[:, 1] - edges_a[:, 0]
+    vector_b = edges_b[:, 1] - edges_b[:, 0]
+    vector_c = edges_b[:, 0] - edges_a[:, 0]
+    normal = np.cross(vector_a, vector_b)
+    divisor = np.einsum("ij,ij->i", normal, normal)
+    # Parallel, or zero length edges have no intersection
+    valid = divisor != 0.0
+    divisor = np.where(valid, divisor, 1.0)
+
+    factor = np.einsum("ij,ij->i", np.cross(vector_c, vector_b), normal) / divisor
+    point_a = edges_a[:, 0] + factor[:, None] * vector_a
+    # Non co-planar lines, second closest point is offset along the common normal
+    skew = np.abs(np.einsum("ij,ij->i", vector_c, normal)) > 1.0e-6
+    offset = np.einsum("ij,ij->i", -vector_c, normal) / divisor
+    point_b = point_a - np.where(skew, offset, 0.0)[:, None] * normal
+
+    param_a, on_a = point_params_on_edges(point_a, edges_a, tolerance)
+    param_b, on_b = point_params_on_edges(point_a, edges_b, tolerance)
+    valid &= on_a & on_b & (np.linalg.norm(point_a - point_b, axis=1) <= tolerance)
+    return point_a, param_a, param_b, valid
+
+
+def intersect_segments_2d(segments_a, segments_b, tolerance=1.0e-5):
+    """Intersect Many Pairs of 2D Segments in one Pass.
+
+    Args:
+        segments_a: Float Array (N, 2, 2) of First Segment End Coordinates
+        segments_b: Float Array (N, 2, 2) of Second Segment End Coordinates
+        tolerance: Distance an intersection may lie beyond the segment ends
+
+    Returns:
+        Float Arrays (N,) of Parameters along first and second Segments,
+        Boolean Array (N,) of Valid Intersections.
+    """
+
+    dir_a = segments_a[:, 1] - segments_a[:, 0]
+    dir_b = segments_b[:, 1] - segments_b[:, 0]
+    offset = segments_b[:, 0] - segments_a[:, 0]
+    denom = dir_a[:, 0] * dir_b[:, 1] - dir_a[:, 1] * dir_b[:, 0]
+    # Parallel, or zero length segments have no single intersection
+    valid = denom != 0.0
+    denom = np.where(valid, denom, 1.0)
+    param_a = (offset[:, 0] * dir_b[:, 1] - offset[:, 1] * dir_b[:, 0]) / denom
+    param_b = (offset[:, 0] * dir_a[:, 1] - offset[:, 1] * dir_a[:, 0]) / denom
+    with np.errstate(divide="ignore"):
+        slack_a = tolerance / np.linalg.norm(dir_a, axis=1)
+        slack_b = tolerance / np.linalg.norm(dir_b, axis=1)
+    valid &= (param_a >= -slack_a) & (param_a <= 1.0 + slack_a)
+    valid &= (param_b >= -slack_b) & (param_b <= 1.0 + slack_b)
+    return param_a, param_b, valid
+
+
+def sweep_line_pairs(segments, tolerance=1.0e-5):
+    """Find Pairs of 2D Segments that Intersect using a Bentley-Ottmann Sweep.
+
+    Note:
+        Runs in O((n + k) log n) for n segments and k intersections. Segments
+        touching an event point within tolerance are reported with it, the
+        caller is expected to confirm each pair with intersect_segments_2d.
+
+    Args:
+        segments: Float Array (N, 2, 2) of Segment End Coordinates
+        tolerance: Distance within which segments are considered to touch
+
+    Returns:
+        Integer Array (P, 2) of Row Pairs (lower row first), sorted.
+    """
+
+    left = []
+    right = []
+    for start, end in segments.tolist():
+        start, end = tuple(start), tuple(end)
+        left.append(min(start, end))
+        right.append(max(start, end))
+
+    starts = defaultdict(list)
+    events = []
+    for idx, (start, end) in enumerate(zip(left, right)):
+        starts[start].append(idx)
+        events.append(start)
+        events.append(end)
+    heapq.heapify(events)
+
+    def y_at(idx, x_loc, y_loc):
+        """Height of a segment on the sweep line, vertical segments meet the event."""
+        (x_1, y_1), (x_2, y_2) = left[idx], right[idx]
+        if x_2 <= x_1:
+            return min(max(y_loc, y_1), y_2)
+        if x_loc <= x_1:
+            return y_1
+        if x_loc >= x_2:
+            return y_2
+        return y_1 + (x_loc - x_1) * (y_2 - y_1) / (x_2 - x_1)
+
+    def slope(idx):
+        """Slope of a segment, vertical segments sort above all others."""
+        (x_1, y_1), (x_2, y_2) = left[idx], right[idx]
+        if x_2 <= x_1:
+            return float("inf"), idx
+        return (y_2 - y_1) / (x_2 - x_1), idx
+
+    found = set()
+    checked = set()
+
+    def check(idx_a, idx_b, point):
+        """Report a crossing of two neighbours & queue it if still ahead."""
+        pair = (min(idx_a, idx_b), max(idx_a, idx_b))
+        if pair in checked:
+            return
+        checked.add(pair)
+        (x_1, y_1), (x_2, y_2) = left[pair[0]], right[pair[0]]
+        (x_3, y_3), (x_4, y_4) = left[pair[1]], right[pair[1]]
+        dir_ax, dir_ay, dir_bx, dir_by = x_2 - x_1, y_2 - y_1, x_4 - x_3, y_4 - y_3
+        denom = dir_ax * dir_by - dir_ay * dir_bx
+        if denom == 0.0:
+            return
+        param_a = ((x_3 - x_1) * dir_by - (y_3 - y_1) * dir_bx) / denom
+        param_b = ((x_3 - x_1) * dir_ay - (y_3 - y_1) * dir_ax) / denom
+        slack_a = tolerance / hypot(dir_ax, dir_ay)
+        slack_b = tolerance / hypot(dir_bx, dir_by)
+        if not (-slack_a <= param_a <= 1.0 + slack_a and -slack_b <= param_b <= 1.0 + slack_b):
+            return
+        found.add(pair)
+        factor = min(max(param_a, 0.0), 1.0)
+        crossing = (x_1 + dir_ax * factor, y_1 + dir_ay * factor)
+        if crossing > point:
+            heapq.heappush(events, crossing)
+
+    status = []
+    last = None
+    while events:
+        point = heapq.heappop(events)
+        if point == last:
+            continue
+        last = point
+        x_loc, y_loc = point
+
+        # Segments in the status containing this point are contiguous
+        low, high = 0, len(status)
+        while low < high:
+            mid = (low + high) // 2
+            if y_at(status[mid], x_loc, y_loc) < y_loc - tolerance:
+                low = mid + 1
+            else:
+                high = mid
+        first = end = low
+        while end < len(status) and y_at(status[end], x_loc, y_loc) <= y_loc + tolerance:
+            end += 1
+        containing = status[first:end]
+
+        involved = sorted(set(starts.get(point, [])) | set(containing))
+        for pos, idx_a in enumerate(involved):
+            for idx_b in involved[pos + 1:]:
+                found.add((idx_a, idx_b))
+
+        # Re-insert what continues past this point, ordered just right of it
+        block = sorted(
+            (idx for idx in set(starts.get(point, [])) | set(containing) if right[idx] > point),
+            key=slope,
+        )
+        status[first:end] = block
+        end = first + len(block)
+        if not block:
+            if 0 < first < len(status):
+                check(status[first - 1], status[first], point)
+        else:
+            if first > 0:
+                check(status[first - 1], block[0], point)
+            if end < len(status):
+                check(block[-1], status[end], point)
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.array(sorted(found), dtype=np.int64)
@@ -0,0 +1,231 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+#
+# <pep8 compliant>
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Maths Expression Evaluator, used by Maths Commands in place of eval.
+#
+# Expressions are parsed once, checked against a whitelist of numbers, names,
+# operators & functions, then built into nested functions that are cached.
+# Like pdt_geometry, this module must not import Blender modules.
+#
+import ast
+import math
+import operator
+import numpy as np
+from functools import lru_cache
+
+
+class ExpressionError(ValueError):
+    """Invalid, or Disallowed, Maths Expression Exception."""
+    pass
+
+
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+FUNCTIONS = {
+    name: getattr(math, name)
+    for name in (
+        "acos", "acosh", "asin", "asinh", "atan", "atan2", "atanh", "ceil", "copysign",
+        "cos", "cosh", "degrees", "erf", "erfc", "exp", "expm1", "fabs", "floor", "fmod",
+        "gamma", "hypot", "lgamma", "log", "log10", "log1p", "log2", "pow", "radians",
+        "sin", "sinh", "sqrt", "tan", "tanh", "trunc",
+    )
+}
+FUNCTIONS.update(abs=abs, min=min, max=max, round=lambda x, n=0: round(x, int(n)))
+
+# Numpy equivalents for Array Expressions, others are vectorised from FUNCTIONS
+ARRAY_FUNCTIONS = {name: np.vectorize(function) for name, function in FUNCTIONS.items()}
+ARRAY_FUNCTIONS.update(
+    acos=np.arccos, acosh=np.arccosh, asin=np.arcsin, asinh=np.arcsinh, atan=np.arctan,
+    atan2=np.arctan2, atanh=np.arctanh, ceil=np.ceil, copysign=np.copysign, cos=np.cos,
+    cosh=np.cosh, degrees=np.degrees, exp=np.exp, expm1=np.expm1, fabs=np.fabs,
+    floor=np.floor, fmod=np.fmod, log10=np.log10, log1p=np.log1p,
+    log2=np.log2, pow=np.power, radians=np.radians, sin=np.sin, sinh=np.sinh,
+    sqrt=np.sqrt, tan=np.tan, tanh=np.tanh, trunc=np.trunc, abs=np.abs,
+    # Any number of Arguments, as the scalar Functions, ufuncs take 2 and an out
+    min=lambda *values: np.minimum.reduce(np.broadcast_arrays(*values)),
+    max=lambda *values: np.maximum.reduce(np.broadcast_arrays(*values)),
+    hypot=lambda *values: np.hypot.reduce(np.broadcast_arrays(*values)),
+    log=lambda x, base=None: np.log(x) if base is None else np.log(x) / np.log(base),
+    round=lambda x, n=0: np.round(x, int(n)),
+)
+
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+UNARY_OPERATORS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def build_node(node, names, functions):
+    """Build a Function that evaluates one Expression Node.
+
+    Args:
+        node: ast Node of the Expression
+        names: Frozenset of Variable Names the Expression may use
+        functions: Dictionary of Function Names to Functions
+
+    Returns:
+        Function taking a Dictionary of Variable Values.
+    """
+
+    kind = type(node).__name__
+    if kind in {"Constant", "Num"}:
+        value = node.n if kind == "Num" else node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ExpressionError(f"Only Numbers are allowed, not {value!r}")
+        # Floats only, so Powers overflow instead of building huge Integers
+        value = float(value)
+        return lambda variables: value
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in names:
+            return lambda variables: variables[name]
+        if name in CONSTANTS:
+            value = CONSTANTS[name]
+            return lambda variables: value
+        raise ExpressionError(f"Unknown Name {name!r}")
+
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        function = BINARY_OPERATORS[type(node.op)]
+        left = build_node(node.left, names, functions)
+        right = build_node(node.right, names, functions)
+        return lambda variables: function(left(variables), right(variables))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        function = UNARY_OPERATORS[type(node.op)]
+        operand = build_node(node.operand, names, functions)
+        return lambda variables: function(operand(variables))
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        if node.func.id not in functions:
+            raise ExpressionError(f"Unknown Function {node.func.id!r}")
+        function = functions[node.func.id]
+        arguments = [build_node(argument, names, functions) for argument in node.args]
+        return lambda variables: function(*[argument(variables) for argument in arguments])
+
+    raise ExpressionError(f"{kind} is not allowed in Maths Expressions")
+
+
+def split_expressions(text):
+    """Split Text into Expressions at Commas outside Brackets.
+
+    Note:
+        Example; "atan2(i, 2), i, 0" gives ["atan2(i, 2)", "i", "0"].
+
+    Args:
+        text: Comma separated Expressions
+
+    Returns:
+        List of Expression Strings, stripped of surrounding spaces.
+    """
+
+    expressions = []
+    depth = 0
+    start = 0
+    for position, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            expressions.append(text[start:position].strip())
+            start = position + 1
+    expressions.append(text[start:].strip())
+    return expressions
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expression, names=(), array=False):
+    """Compile a Maths Expression, results are cached.
+
+    Args:
+        expression: The Expression String, e.g. "degrees(atan(3/4))"
+        names: Tuple of Variable Names the Expression may use
+        array: Use Numpy Functions, so Variables may be Arrays
+
+    Returns:
+        Function taking a Dictionary of Variable Values.
+    """
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as error:
+        raise ExpressionError(f"Bad Syntax in {expression!r}") from error
+    except (RecursionError, MemoryError) as error:
+        raise ExpressionError(f"{expression!r} is nested too deeply") from error
+    functions = ARRAY_FUNCTIONS if array else FUNCTIONS
+    try:
+        return build_node(tree.body, frozenset(names), functions)
+    except RecursionError as error:
+        raise ExpressionError(f"{expression!r} is nested too deeply") from error
+
+
+def evaluate(expression, **variables):
+    """Evaluate a Maths Expression to a Float.
+
+    Args:
+        expression: The Expression String
+        variables: Values of Variables used by the Expression
+
+    Returns:
+        Float Result.
+    """
+
+    compiled = compile_expression(expression, tuple(sorted(variables)))
+    try:
+        return float(compiled(variables))
+    except (ArithmeticError, ValueError, TypeError, RecursionError) as error:
+        raise ExpressionError(f"{expression!r} failed: {error}") from error
+
+
+def evaluate_array(expression, **variables):
+    """Evaluate a Maths Expression over Arrays.
+
+    Note:
+        Example; evaluate_array("sin(i / 10)", i=np.arange(1000)) returns 1000 Values.
+
+    Args:
+        expression: The Expression String
+        variables: Arrays, or Floats, for Variables used by the Expression
+
+    Returns:
+        Float Array broadcast to the shape of the Variables.
+    """
+
+    arrays = {name: np.asarray(value, dtype=np.float64) for name, value in variables.items()}
+    compiled = compile_expression(expression, tuple(sorted(arrays)), array=True)
+    try:
+        with np.errstate(all="raise"):
+            result = compiled(arrays)
+    except (ArithmeticError, ValueError, TypeError, RecursionError) as error:
+        raise ExpressionError(f"{expression!r} failed: {error}") from error
+    shape = np.broadcast(*arrays.values()).shape if arrays else ()
+    return np.broadcast_to(np.asarray(result, dtype=np.float64), shape)
@@ -0,0 +1,169 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+#
+# <pep8 compliant>
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Minimal stand-in for the parts of mathutils used with the Geometry Core,
+# so PDT routines can be tested and profiled in plain Python.
+#
+# This module is never loaded by the Add-on inside Blender.
+#
+import numpy as np
+
+try:
+    from .pdt_geometry import line_line_closest, point_line_closest
+except ImportError:
+    from pdt_geometry import line_line_closest, point_line_closest
+
+
+class Vector:
+    """Stand-in for mathutils.Vector, held as a Float Array.
+
+    Args:
+        seq: Sequence of Coordinates, default (0, 0, 0)
+    """
+
+    __slots__ = ("_co",)
+
+    def __init__(self, seq=(0.0, 0.0, 0.0)):
+        self._co = np.array(seq, dtype=np.float64).reshape(-1)
+
+    def __len__(self):
+        return len(self._co)
+
+    def __iter__(self):
+        return iter(self._co.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._co[index].tolist())
+        return float(self._co[index])
+
+    def __setitem__(self, index, value):
+        self._co[index] = value
+
+    def __array__(self, dtype=None, copy=None):
+        return self._co.astype(dtype) if dtype is not None else self._co.copy()
+
+    def __repr__(self):
+        return f"Vector({tuple(self._co.tolist())})"
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __add__(self, other):
+        return Vector(self._co + np.asarray(other, dtype=np.float64))
+
+    def __sub__(self, other):
+        return Vector(self._co - np.asarray(other, dtype=np.float64))
+
+    def __mul__(self, other):
+        # Element-wise, as mathutils since Blender 2.80, @ is the Dot Product
+        return Vector(self._co * np.asarray(other, dtype=np.float64))
+
+    def __matmul__(self, other):
+        return float(self._co.dot(np.asarray(other, dtype=np.float64)))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+    __rmatmul__ = __matmul__
+
+    def __rsub__(self, other):
+        return Vector(np.asarray(other, dtype=np.float64) - self._co)
+
+    def __truediv__(self, other):
+        return Vector(self._co / other)
+
+    def __neg__(self):
+        return Vector(-self._co)
+
+    def _get_axis(index):
+        return property(
+            lambda self: float(self._co[index]),
+            lambda self, value: self.__setitem__(index, value),
+        )
+
+    x = _get_axis(0)
+    y = _get_axis(1)
+    z = _get_axis(2)
+    del _get_axis
+
+    @property
+    def length(self):
+        return float(np.linalg.norm(self._co))
+
+    @property
+    def length_squared(self):
+        return float(self._co.dot(self._co))
+
+    def copy(self):
+        return Vector(self._co)
+
+    def dot(self, other):
+        return float(self._co.dot(np.asarray(other, dtype=np.float64)))
+
+    def cross(self, other):
+        return Vector(np.cross(self._co, np.asarray(other, dtype=np.float64)))
+
+    def lerp(self, other, factor):
+        return Vector(self._co + (np.asarray(other, dtype=np.float64) - self._co) * factor)
+
+    def normalized(self):
+        length = self.length
+        return Vector(self._co / length if length else self._co)
+
+    def to_tuple(self, precision=-1):
+        if precision < 0:
+            return tuple(self._co.tolist())
+        return tuple(round(co, precision) for co in self._co.tolist())
+
+
+def intersect_line_line(v1, v2, v3, v4):
+    """Stand-in for mathutils.geometry.intersect_line_line.
+
+    Args:
+        v1, v2: 2 Points on the First Line
+        v3, v4: 2 Points on the Second Line
+
+    Returns:
+        Tuple of 2 Vectors, closest Points on each Line, None if the Lines are Parallel.
+    """
+
+    line = line_line_closest(v1, v2, v3, v4)
+    if line is None:
+        return None
+    return Vector(line[0]), Vector(line[1])
+
+
+def intersect_point_line(pt, line_p1, line_p2):
+    """Stand-in for mathutils.geometry.intersect_point_line.
+
+    Args:
+        pt: Point
+        line_p1, line_p2: 2 Points on the Line
+
+    Returns:
+        Vector of Closest Point and Float Parameter along the Line.
+    """
+
+    closest, param = point_line_closest(pt, line_p1, line_p2)
+    return Vector(closest), param
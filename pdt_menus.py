@@ -54,6 +54,9 @@ from .pdt_msg_strings import (
     PDT_LAB_PIVOTLOCH,
     PDT_LAB_PIVOTSIZE,
     PDT_LAB_PIVOTWIDTH,
+    PDT_LAB_PLANAR,
+    PDT_LAB_INCREMENTAL,
+    PDT_LAB_SCRIPT,
     PDT_LAB_PLANE,
     PDT_LAB_PROFILE,
     PDT_LAB_RADIUS,
@@ -206,7 +209,13 @@ class PDT_PT_PanelTools(Panel):
         row.operator("pdt.linetobisect", text=PDT_LAB_BISECT)
         row = layout.row()
         row.operator("pdt.edge_to_face", text=PDT_LAB_EDGETOEFACE)
+        #
+        # Intersect All tool
+        box = layout.box()
+        row = box.row()
         row.operator("pdt.intersectall", text=PDT_LAB_INTERSETALL)
+        row.prop(pdt_pg, "intersect_planar", text=PDT_LAB_PLANAR)
+        row.prop(pdt_pg, "intersect_incremental", text=PDT_LAB_INCREMENTAL)
         #
         # Taper tool
         box = layout.box()
@@ -274,6 +283,11 @@ class PDT_PT_PanelPivotPoint(Panel):
         col.prop(pdt_pg, "pivot_ang", text="Angle")
         row = layout.row()
         col = row.column()
+        col.operator("pdt.polararray", icon="EMPTY_AXIS", text="Polar Array")
+        col = row.column()
+        col.prop(pdt_pg, "pivot_count", text="Copies")
+        row = layout.row()
+        col = row.column()
         col.operator("pdt.viewscale", icon="EMPTY_AXIS", text="Scale")
         col = row.column()
         col.operator("pdt.cursorpivot", icon="EMPTY_AXIS", text="Cursor To Pivot")
@@ -287,6 +301,8 @@ class PDT_PT_PanelPivotPoint(Panel):
         split.label(text="Scale")
         split.prop(pdt_pg, "pivot_scale", text="")
         row = layout.row()
+        row.prop(pdt_pg, "pivot_scale_view", text="Scale in View Axes")
+        row = layout.row()
         col = row.column()
         col.operator("pdt.pivotwrite", icon="FILE_TICK", text="PP Write")
         col = row.column()
@@ -413,4 +429,7 @@ class PDT_PT_PanelCommandLine(Panel):
         # Try Re-run
         row.operator("pdt.command_rerun", text="", icon="LOOP_BACK")
         row = layout.row()
+        row.prop(pdt_pg, "command_script", text="")
+        row.operator("pdt.command_script", text=PDT_LAB_SCRIPT)
+        row = layout.row()
         row.prop(pdt_pg, "maths_output", text="Maths Output")
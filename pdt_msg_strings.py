@@ -68,6 +68,9 @@ PDT_LAB_AD3D = "Set A/D 3D"
 PDT_LAB_TAPERAXES = ""  # Intentionally left blank
 PDT_LAB_TAPER = "Taper"
 PDT_LAB_INTERSETALL = "Intersect All"
+PDT_LAB_PLANAR = "Planar"
+PDT_LAB_INCREMENTAL = "Incremental"
+PDT_LAB_SCRIPT = "Run Script"
 PDT_LAB_BISECT = "Bisect"
 PDT_LAB_EDGETOEFACE = "Edge-To-Face"
 PDT_LAB_FILLET = "Fillet"
@@ -132,6 +135,7 @@ PDT_ERR_TAPER_SEL = ("Select at Least 2 Vertices Individually - Active is Rotati
                      + "(Currently selected:")
 PDT_ERR_NO3DVIEW = "View3D not found, cannot run operator"
 PDT_ERR_SCALEZERO = "Scale Distance is 0"
+PDT_ERR_FLATOBJ = "Object has Zero Scale, Origin not moved (Objects:"
 
 PDT_ERR_CHARS_NUM = "Bad Command Format, not enough Characters"
 PDT_ERR_BADFLETTER = "Bad Operator (1st Letter); C D E F G N M P S V or ? only"
@@ -146,11 +150,15 @@ PDT_ERR_EXTEDIT = "Only Extrude Vertices in Edit Mode"
 PDT_ERR_DUPEDIT = "Only Duplicate Geometry in Edit Mode"
 PDT_ERR_FILEDIT = "Only Fillet Geometry in Edit Mode"
 PDT_ERR_NOCOMMAS = "No commas allowed in Maths Command"
+PDT_ERR_BADCOUNT = "Bad Repeat Count, use a Whole Number of 1 or more after *"
+PDT_ERR_ARRAYOP = "Array Commands only work with NA, ND, VA & VD"
 
 PDT_ERR_2CPNPE = "Select 2 Co-Planar Non-Parallel Edges"
 PDT_ERR_NCEDGES = "Edges must be Co-Planar Non-Parallel Edges, Selected Edges aren't"
 PDT_ERR_1EDGE1FACE = "Select 1 face and 1 Detached Edge"
 PDT_ERR_NOINT = "No Intersection Found"
+PDT_ERR_NO_SCRIPT = "Command Script File not Found:"
+PDT_ERR_SCRIPT = "Command Script Stopped at Line"
 
 # Info messages
 #
@@ -182,7 +190,9 @@ PDT_DES_OBORDER = "Object Order to Lines"
 PDT_DES_VALIDLET = "Valid 1st letters; C D E G N P S V, Valid 2nd letters: A D I O P"
 PDT_DES_OUTPUT = "Output for Maths Operations"
 PDT_DES_PPLOC = "Location of PivotPoint"
+PDT_DES_PPCOUNT = "Number of Polar Array Copies, spaced by Pivot Angle, or round a Circle if it is 0"
 PDT_DES_PPSCALEFAC = "Scale Factors"
+PDT_DES_PPSCALEVIEW = "Apply Scale Factors along the View's Axes, not the Global Axes"
 PDT_DES_PPSIZE = "Pivot Size Factor"
 PDT_DES_PPWIDTH = "Pivot Line Width in Pixels"
 PDT_DES_PPTRANS = "Pivot Point Transparency"
@@ -192,3 +202,6 @@ PDT_DES_FILLETSEG = "Number of Fillet Segments"
 PDT_DES_FILLETPROF = "Fillet Profile"
 PDT_DES_FILLETVERTS = "Use Vertices, or Edges, Set to False for Extruded Geometry"
 PDT_DES_FILLINT = "Intersect & Fillet Two Selected Edges"
+PDT_DES_INTPLANAR = "Intersect All in the Working Plane, Edges are Projected onto it"
+PDT_DES_SCRIPT = "Command Script File, one Command per Line"
+PDT_DES_INTINCREMENTAL = "Intersect All only Tests New or Changed Edges against those already Intersected"
@@ -26,7 +26,14 @@ import bmesh
 from bpy.types import Operator, SpaceView3D
 from mathutils import Vector, Matrix
 from math import pi
-from .pdt_functions import view_coords, draw_callback_3d
+from .pdt_functions import (
+    view_coords,
+    draw_callback_3d,
+    get_selection,
+    get_view_transform,
+    set_mode,
+    update_sel,
+)
 from .pdt_msg_strings import (
     PDT_CON_AREYOURSURE,
     PDT_ERR_EDIT_MODE,
@@ -176,6 +183,129 @@ class PDT_OT_ViewPlaneRotate(Operator):
         return {"FINISHED"}
 
 
+class PDT_OT_PolarArray(Operator):
+    """Copy Selected Geometry in a Circle about the Pivot Point."""
+
+    bl_idname = "pdt.polararray"
+    bl_label = "PDT Polar Array"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        """Check Object Status.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Nothing.
+        """
+
+        obj = context.object
+        if obj is None:
+            return False
+        return all([bool(obj), obj.type == "MESH", obj.mode == "EDIT"])
+
+    def execute(self, context):
+        """Make Rotated Copies of Selected Geometry about the Pivot Point.
+
+        Note:
+            Copies are spaced by pg.pivot_ang, or evenly round a full circle if
+            that is 0, about the Working Plane's Normal, or the View's in View Plane.
+            Copies are made by doubling, each round duplicates every Copy made so
+            far at once & rotates the new ones in one transform, so N Copies take
+            about log2(N) bmesh operations. The Copies are left selected.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Note:
+            Uses pg.pivot_loc, pg.pivot_ang, pg.pivot_count & pg.plane scene variables
+
+        Returns:
+            Status Set.
+        """
+
+        scene = context.scene
+        pg = scene.pdt_pg
+        obj = bpy.context.view_layer.objects.active
+        if obj is None:
+            self.report({"ERROR"}, PDT_ERR_NO_ACT_OBJ)
+            return {"FINISHED"}
+        if obj.mode != "EDIT":
+            error_message = f"{PDT_ERR_EDIT_MODE} {obj.mode})"
+            self.report({"ERROR"}, error_message)
+            return {"FINISHED"}
+        bm = bmesh.from_edit_mesh(obj.data)
+        geom = get_selection(bm).geom
+        if len(geom) == 0:
+            self.report({"ERROR"}, PDT_ERR_NO_SEL_GEOM)
+            return {"FINISHED"}
+
+        if pg.plane == "LO":
+            axis = view_coords(0, 0, 1).normalized()
+        else:
+            axis = Vector((0, 0, 0))
+            axis[set_mode(pg.plane)[2]] = 1
+        count = pg.pivot_count
+        step = pg.pivot_ang * pi / 180 if pg.pivot_ang != 0 else 2 * pi / (count + 1)
+        centre = pg.pivot_loc - obj.matrix_world.decompose()[0]
+        to_centre = Matrix.Translation(centre)
+        from_centre = Matrix.Translation(-centre)
+
+        # copies[k] is the Geometry rotated by k steps, copies[0] the Selection
+        copies = [geom]
+        verts_new, edges_new, faces_new = [], [], []
+        while len(copies) <= count:
+            made = len(copies)
+            needed = min(made, count + 1 - made)
+            source = [ele for copy in copies[:needed] for ele in copy]
+            result = bmesh.ops.duplicate(bm, geom=source)
+            # The maps hold both Original to Duplicate & Duplicate to Original
+            mapping = {**result["vert_map"], **result["edge_map"], **result["face_map"]}
+            copies.extend([mapping[ele] for ele in copy] for copy in copies[:needed])
+            verts_dupe = [v for v in result["geom"] if isinstance(v, bmesh.types.BMVert)]
+            matrix = to_centre @ Matrix.Rotation(step * made, 4, axis) @ from_centre
+            bmesh.ops.transform(bm, matrix=matrix, verts=verts_dupe)
+            verts_new.extend(verts_dupe)
+            edges_new.extend(e for e in result["geom"] if isinstance(e, bmesh.types.BMEdge))
+            faces_new.extend(f for f in result["geom"] if isinstance(f, bmesh.types.BMFace))
+        update_sel(bm, verts_new, edges_new, faces_new)
+        bmesh.update_edit_mesh(obj.data)
+        return {"FINISHED"}
+
+
+def pivot_scale_matrix(matrix_world, pivot, factors, view_axes=None):
+    """Build the Matrix that Scales Local Coordinates about the Pivot Point.
+
+    Note:
+        Without view_axes the Factors are along the Object's Local Axes, about
+        the Pivot offset by the Object's Location, as PDT has always scaled.
+        With view_axes the Factors are along the View's Axes & the Pivot is
+        brought into Local Space, so it stays fixed on Rotated Objects.
+
+    Args:
+        matrix_world: The Object's World Matrix
+        pivot: Pivot Point Location in World Space
+        factors: Scale Factors along X, Y & Z
+        view_axes: Matrix with the View's orthonormal Axes in World Space as Columns
+
+    Returns:
+        4x4 Matrix for bmesh.ops.transform.
+    """
+
+    scale = Matrix.Diagonal(factors)
+    if view_axes is None:
+        centre = pivot - matrix_world.decompose()[0]
+    else:
+        centre = matrix_world.inverted_safe() @ pivot
+        rotation = matrix_world.to_3x3()
+        # Scale in Global Space, then bring it into the Object's Local Space
+        scale = view_axes @ scale @ view_axes.transposed()
+        scale = rotation.inverted_safe() @ scale @ rotation
+    return Matrix.Translation(centre) @ scale.to_4x4() @ Matrix.Translation(-centre)
+
+
 class PDT_OT_ViewPlaneScale(Operator):
     """Scale Selected Vertices about Pivot Point."""
 
@@ -211,7 +341,9 @@ class PDT_OT_ViewPlaneScale(Operator):
             context: Blender bpy.context instance.
 
         Note:
-            Uses pg.pivot_loc, pg.pivot_scale scene variables
+            Uses pg.pivot_loc, pg.pivot_scale & pg.pivot_scale_view scene variables
+            The Scale is one Affine Matrix, applied to all Vertices by bmesh.ops.transform.
+            With pg.pivot_scale_view the Scale Factors are along the View's X, Y & Z.
 
         Returns:
             Status Set.
@@ -228,19 +360,17 @@ class PDT_OT_ViewPlaneScale(Operator):
             self.report({"ERROR"}, error_message)
             return {"FINISHED"}
         bm = bmesh.from_edit_mesh(obj.data)
-        verts = verts = [v for v in bm.verts if v.select]
-        for v in verts:
-            delta_x = (pg.pivot_loc.x - obj.matrix_world.decompose()[0].x - v.co.x) * (
-                1 - pg.pivot_scale.x
-            )
-            delta_y = (pg.pivot_loc.y - obj.matrix_world.decompose()[0].y - v.co.y) * (
-                1 - pg.pivot_scale.y
-            )
-            delta_z = (pg.pivot_loc.z - obj.matrix_world.decompose()[0].z - v.co.z) * (
-                1 - pg.pivot_scale.z
-            )
-            delta_v = Vector((delta_x, delta_y, delta_z))
-            v.co = v.co + delta_v
+        verts = [v for v in bm.verts if v.select]
+        view_axes = None
+        if pg.pivot_scale_view:
+            view = get_view_transform()
+            if view is None:
+                self.report({"ERROR"}, PDT_ERR_NO3DVIEW)
+                return {"FINISHED"}
+            # Columns are the View's Axes in Global Space
+            view_axes = view.matrix_inverted
+        matrix = pivot_scale_matrix(obj.matrix_world, pg.pivot_loc, pg.pivot_scale, view_axes)
+        bmesh.ops.transform(bm, matrix=matrix, verts=verts)
         bmesh.update_edit_mesh(obj.data)
         return {"FINISHED"}
 
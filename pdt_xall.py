@@ -25,15 +25,29 @@
 #
 import bpy
 import bmesh
+import numpy as np
+from mathutils import Vector
 from mathutils.geometry import intersect_line_line as LineIntersect
-import itertools
 from collections import defaultdict
 from . import pdt_cad_module as cm
-from .pdt_functions import oops
+from .pdt_functions import (
+    set_mode,
+    show_message,
+    update_edit_mesh,
+    view_coords_i,
+    weld_vertices,
+)
+from .pdt_geometry import edge_key
 from .pdt_msg_strings import (
     PDT_ERR_EDOB_MODE
 )
 
+# Above this many candidate pairs the vectorised intersection kernel is used
+BATCH_THRESHOLD = 500
+
+# Edge Indices of Resolved Edges for Incremental Intersect All, keyed by Mesh
+EDGE_INDICES = {}
+
 
 def order_points(edge, point_list):
     """Order these edges from distance to v1, then sandwich the sorted list with v1, v2."""
@@ -48,43 +62,49 @@ def order_points(edge, point_list):
     return [v1] + point_list + [v2]
 
 
-def remove_permutations_that_share_a_vertex(bm, permutations):
+def remove_permutations_that_share_a_vertex(bm, permutations, table=None):
     """Get useful Permutations.
 
     Args:
         bm: Object's Bmesh
         permutations: Possible Intersection Edges as a list
+        table: Optional EdgeTable holding the Edges
 
     Returns:
         List of Edges.
     """
 
-    final_permutations = []
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        if len(set(raw_vert_indices)) < 4:
-            continue
+    if not permutations:
+        return []
+    if table is None:
+        table = cm.EdgeTable(bm, np.unique(permutations).tolist())
+    share = cm.pairs_share_vertex(table.vert_indices, table.rows(permutations))
+    return [permutations[i] for i in np.flatnonzero(~share).tolist()]
 
-        # reaches this point if they do not share.
-        final_permutations.append(edges)
 
-    return final_permutations
-
-
-def get_valid_permutations(bm, edge_indices):
+def get_valid_permutations(bm, edge_indices, table=None):
     """Get useful Permutations.
 
+    Note:
+        Only pairs of edges whose bounding boxes overlap are considered.
+
     Args:
         bm: Object's Bmesh
         edge_indices: List of indices of Edges to consider
+        table: Optional EdgeTable holding the Edges, in edge_indices order
 
     Returns:
         List of suitable Edges.
     """
 
-    raw_permutations = itertools.permutations(edge_indices, 2)
-    permutations = [r for r in raw_permutations if r[0] < r[1]]
-    return remove_permutations_that_share_a_vertex(bm, permutations)
+    if table is None:
+        table = cm.EdgeTable(bm, edge_indices)
+    # Broad Phase, only pairs whose bounding boxes overlap can intersect
+    pairs = cm.broad_phase_pairs(table.coords)
+    pairs = pairs[~cm.pairs_share_vertex(table.vert_indices, pairs)]
+    pairs = np.sort(table.edge_indices.astype(np.int64)[pairs], axis=1)
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    return list(map(tuple, pairs.tolist()))
 
 
 def can_skip(closest_points, vert_vectors):
@@ -122,28 +142,247 @@ def get_intersection_dictionary(bm, edge_indices):
         Dictionary of Vectors.
     """
 
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
+    table = cm.EdgeTable(bm, edge_indices)
+    permutations = get_valid_permutations(bm, edge_indices, table)
+    return intersect_permutations(bm, table, permutations)
+
 
-    permutations = get_valid_permutations(bm, edge_indices)
+def intersect_permutations(bm, table, permutations):
+    """Return a dictionary of edge indices and points found where edge pairs cross.
+
+    Args:
+        bm, Object's Bmesh
+        table: EdgeTable holding the Edges
+        permutations: List of Pairs of Edge Indices to intersect
+
+    Returns:
+        Dictionary of Vectors.
+    """
 
     list_k = defaultdict(list)
-    list_d = defaultdict(list)
 
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        vert_vectors = cm.vectors_from_indices(bm, raw_vert_indices)
+    if len(permutations) > BATCH_THRESHOLD:
+        # Many pairs, test them all at once
+        pair_rows = table.rows(permutations)
+        points, _, _, valid = cm.intersect_edges_batch(
+            table.coords[pair_rows[:, 0]], table.coords[pair_rows[:, 1]]
+        )
+        for pair in np.flatnonzero(valid).tolist():
+            point = Vector(points[pair])
+            [list_k[edge].append(point) for edge in permutations[pair]]
+    else:
+        pair_coords = cm.coords_tuples_from_edge_indices(table, permutations)
+        for edges, coords in zip(permutations, pair_coords.reshape(-1, 4, 3).tolist()):
+            vert_vectors = [Vector(co) for co in coords]
 
-        points = LineIntersect(*vert_vectors)
+            points = LineIntersect(*vert_vectors)
 
-        # some can be skipped.    (NaN, None, not on both edges)
-        if can_skip(points, vert_vectors):
-            continue
+            # some can be skipped.    (NaN, None, not on both edges)
+            if can_skip(points, vert_vectors):
+                continue
 
-        # reaches this point only when an intersection happens on both edges.
-        [list_k[edge].append(points[0]) for edge in edges]
+            # reaches this point only when an intersection happens on both edges.
+            [list_k[edge].append(points[0]) for edge in edges]
 
     # list_k will contain a dict of edge indices and points found on those edges.
+    return order_intersections(bm, list_k)
+
+
+def get_edge_index(mesh):
+    """Return the Edge Index of Resolved Edges kept for a Mesh.
+
+    Args:
+        mesh: Mesh Data of the Object
+
+    Returns:
+        Dictionary of Resolved Edges and the Grid Cells they cover.
+    """
+
+    return EDGE_INDICES.setdefault(
+        (mesh.as_pointer(), mesh.name),
+        {"cell_size": None, "edges": set(), "cells": defaultdict(set)},
+    )
+
+
+def index_edge_cells(edge_index, edge_coords):
+    """Return the Grid Cells of an Edge Index covered by each Edge.
+
+    Args:
+        edge_index: Dictionary of Resolved Edges for a Mesh
+        edge_coords: Array (N, 2, 3) of Edge End Coordinates
+
+    Returns:
+        Integer Array of Edge Rows and List of Cell Tuples.
+    """
+
+    mins = edge_coords.min(axis=1) - 1.0e-5
+    maxs = edge_coords.max(axis=1) + 1.0e-5
+    if edge_index["cell_size"] is None:
+        edge_index["cell_size"] = cm.grid_cell_size(mins, maxs)
+    rows, cells = cm.grid_cells(mins, maxs, edge_index["cell_size"])
+    return rows, [tuple(cell) for cell in cells.tolist()]
+
+
+def update_edge_index(edge_index, edge_keys, int_dict):
+    """Replace the Edges cut by Intersect All with their Pieces in an Edge Index.
+
+    Args:
+        edge_index: Dictionary of Resolved Edges for a Mesh
+        edge_keys: Dictionary of Edge Indices and Edge Keys of the Selected Edges
+        int_dict: Dictionary of Edge Indices and the Points they were cut at
+
+    Returns:
+        Nothing.
+    """
+
+    edges = edge_index["edges"]
+    cells = edge_index["cells"]
+    removed = [edge_keys[edge_idx] for edge_idx in int_dict if edge_keys[edge_idx] in edges]
+    if removed:
+        rows, key_cells = index_edge_cells(edge_index, np.array(removed))
+        for row, cell in zip(rows.tolist(), key_cells):
+            cells[cell].discard(removed[row])
+        edges.difference_update(removed)
+
+    added = {key for edge_idx, key in edge_keys.items() if edge_idx not in int_dict}
+    for point_list in int_dict.values():
+        points = np.array([list(point) for point in point_list])
+        for coords in np.stack((points[:-1], points[1:]), axis=1):
+            if not np.array_equal(coords[0], coords[1]):
+                added.add(edge_key(coords))
+    added = list(added - edges)
+    if added:
+        rows, key_cells = index_edge_cells(edge_index, np.array(added))
+        for row, cell in zip(rows.tolist(), key_cells):
+            cells[cell].add(added[row])
+        edges.update(added)
+
+
+def get_incremental_intersection_dictionary(bm, edge_indices, edge_index):
+    """Return a dictionary of edge indices and points found on new or changed edges.
+
+    Note:
+        Edges already in the Edge Index have been intersected with each other,
+        so only pairs with at least one new or changed edge are tested.
+
+    Args:
+        bm, Object's Bmesh
+        edge_indices: List of Edge Indices
+        edge_index: Dictionary of Resolved Edges for the Mesh
+
+    Returns:
+        Dictionary of Vectors and Dictionary of Edge Indices and Edge Keys.
+    """
+
+    table = cm.EdgeTable(bm, edge_indices)
+    edge_coords = table.coords
+    keys = [edge_key(coords) for coords in edge_coords]
+    edge_keys = dict(zip(edge_indices, keys))
+    resolved = edge_index["edges"]
+    new_rows = [row for row, key in enumerate(keys) if key not in resolved]
+
+    if new_rows and len(new_rows) < len(keys):
+        # Start again if the new edges are too long for the cells of the index
+        new_coords = edge_coords[new_rows]
+        _, span = cm.grid_span(
+            new_coords.min(axis=1) - 1.0e-5, new_coords.max(axis=1) + 1.0e-5, edge_index["cell_size"]
+        )
+        if span.prod(axis=1).sum() > 8 * len(keys):
+            edge_index.update(cell_size=None, edges=set(), cells=defaultdict(set))
+            new_rows = list(range(len(keys)))
+
+    if len(new_rows) == len(keys):
+        permutations = get_valid_permutations(bm, edge_indices, table)
+        return intersect_permutations(bm, table, permutations), edge_keys
+
+    # New against New
+    pairs = {
+        (new_rows[a], new_rows[b])
+        for a, b in cm.broad_phase_pairs(edge_coords[new_rows]).tolist()
+    }
+    # New against Resolved, through the cells each new edge covers
+    if new_rows:
+        key_rows = {key: row for row, key in enumerate(keys)}
+        cells = edge_index["cells"]
+        rows, key_cells = index_edge_cells(edge_index, edge_coords[new_rows])
+        for row, cell in zip(rows.tolist(), key_cells):
+            for key in cells.get(cell, ()):
+                pairs.add((new_rows[row], key_rows.get(key)))
+
+    permutations = sorted(
+        {
+            (min(edge_indices[a], edge_indices[b]), max(edge_indices[a], edge_indices[b]))
+            for a, b in pairs
+            if b is not None
+        }
+    )
+    permutations = remove_permutations_that_share_a_vertex(bm, permutations, table)
+    return intersect_permutations(bm, table, permutations), edge_keys
+
+
+def get_planar_intersection_dictionary(bm, edge_indices, plane):
+    """Return a dictionary of edge indices and points where edges cross in a Working Plane.
+
+    Note:
+        Edges are projected onto the Working Plane and intersected there with a
+        sweep line, each edge is then cut at its own point above the crossing.
+
+    Args:
+        bm, Object's Bmesh
+        edge_indices: List of Edge Indices
+        plane: Working Plane, XY, XZ, YZ or LO (View Plane)
+
+    Returns:
+        Dictionary of Vectors.
+    """
+
+    table = cm.EdgeTable(bm, edge_indices)
+    edge_coords = table.coords
+    if plane == "LO":
+        view_axes = np.array([view_coords_i(*axis) for axis in ((1, 0, 0), (0, 1, 0), (0, 0, 1))])
+        flat_coords = (edge_coords @ view_axes)[:, :, :2]
+    else:
+        a1, a2, _ = set_mode(plane)
+        flat_coords = edge_coords[:, :, [a1, a2]]
+
+    pairs = cm.sweep_line_pairs(flat_coords)
+    permutations = sorted(
+        (min(edge_indices[a], edge_indices[b]), max(edge_indices[a], edge_indices[b]))
+        for a, b in pairs.tolist()
+    )
+    permutations = remove_permutations_that_share_a_vertex(bm, permutations, table)
+
+    list_k = defaultdict(list)
+    if permutations:
+        pair_rows = table.rows(permutations)
+        param_a, param_b, valid = cm.intersect_segments_2d(
+            flat_coords[pair_rows[:, 0]], flat_coords[pair_rows[:, 1]]
+        )
+        for pair in np.flatnonzero(valid).tolist():
+            edge_a, edge_b = permutations[pair]
+            for edge, row, param in (
+                    (edge_a, pair_rows[pair, 0], param_a[pair]),
+                    (edge_b, pair_rows[pair, 1], param_b[pair]),
+                ):
+                factor = min(max(param, 0.0), 1.0)
+                start, end = edge_coords[row]
+                list_k[edge].append(Vector(start + (end - start) * factor))
+
+    return order_intersections(bm, list_k)
+
+
+def order_intersections(bm, list_k):
+    """Order the points found on each edge from its first vertex to its second.
+
+    Args:
+        bm, Object's Bmesh
+        list_k: Dictionary of edge indices and unordered points found on those edges
+
+    Returns:
+        Dictionary of Vectors.
+    """
+
+    list_d = defaultdict(list)
     for edge_idx, unordered_points in list_k.items():
         tv1, tv2 = bm.edges[edge_idx].verts
         v1 = bm.verts[tv1.index].co
@@ -155,7 +394,11 @@ def get_intersection_dictionary(bm, edge_indices):
 
 
 def update_mesh(bm, int_dict):
-    """Make new geometry (delete old first).
+    """Make new geometry (then delete old).
+
+    Note:
+        Each point is made into a vertex only once, the end vertices of the
+        original edges are reused and only the new vertices are welded.
 
     Args:
         bm, Object's Bmesh
@@ -165,22 +408,46 @@ def update_mesh(bm, int_dict):
         Nothing.
     """
 
-    orig_e = bm.edges
-    orig_v = bm.verts
+    bm.edges.ensure_lookup_table()
+    old_edges = [bm.edges[edge_idx] for edge_idx in int_dict]
 
-    new_verts = []
-    collect = new_verts.extend
-    for _, point_list in int_dict.items():
-        num_edges_to_add = len(point_list) - 1
-        for i in range(num_edges_to_add):
-            coord_a = orig_v.new(point_list[i])
-            coord_b = orig_v.new(point_list[i + 1])
-            orig_e.new((coord_a, coord_b))
-            bm.normal_update()
-            collect([coord_a, coord_b])
+    # Map each point to the single vertex made for it
+    point_verts = {}
+    for edge in old_edges:
+        for vert in edge.verts:
+            point_verts.setdefault(tuple(vert.co), vert)
 
-    bmesh.ops.delete(bm, geom=[edge for edge in bm.edges if edge.select], context="EDGES")
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+    new_verts = []
+    segments = {}
+    for edge, point_list in zip(old_edges, int_dict.values()):
+        chain = [edge.verts[0]]
+        for point in point_list[1:-1]:
+            key = tuple(point)
+            vert = point_verts.get(key)
+            if vert is None:
+                vert = point_verts[key] = bm.verts.new(point)
+                new_verts.append(vert)
+            chain.append(vert)
+        chain.append(edge.verts[1])
+        for vert_a, vert_b in zip(chain, chain[1:]):
+            if vert_a is not vert_b:
+                segments.setdefault(frozenset((vert_a, vert_b)), (vert_a, vert_b))
+
+    # Make all the new edges before the old ones go, so their vertices survive
+    old_set = set(old_edges)
+    for vert_a, vert_b in segments.values():
+        edge = bm.edges.get((vert_a, vert_b))
+        if edge is None:
+            bm.edges.new((vert_a, vert_b))
+        elif edge in old_set:
+            old_set.discard(edge)
+            edge.select_set(False)
+    bmesh.ops.delete(bm, geom=list(old_set), context="EDGES")
+
+    if new_verts:
+        weld_verts = {vert for pair in segments.values() for vert in pair}
+        weld_vertices(bm, weld_verts)
+    bm.normal_update()
 
 
 def unselect_nonintersecting(bm, d_edges, edge_indices):
@@ -206,6 +473,7 @@ def intersect_all(context):
 
     Note:
         Deletes original edges and replaces with new intersected edges
+        Uses pg.intersect_planar, pg.intersect_incremental & pg.plane scene variables
 
     Args:
         context: Blender bpy.context instance.
@@ -227,21 +495,34 @@ def intersect_all(context):
             selected_edges = [edge for edge in bm.edges if edge.select]
             edge_indices = [i.index for i in selected_edges]
 
-            int_dict = get_intersection_dictionary(bm, edge_indices)
+            edge_index = None
+            if pg.intersect_planar:
+                int_dict = get_planar_intersection_dictionary(bm, edge_indices, pg.plane)
+            elif pg.intersect_incremental:
+                edge_index = get_edge_index(obj.data)
+                int_dict, edge_keys = get_incremental_intersection_dictionary(
+                    bm, edge_indices, edge_index
+                )
+            else:
+                int_dict = get_intersection_dictionary(bm, edge_indices)
+            if edge_index is None:
+                EDGE_INDICES.pop((obj.data.as_pointer(), obj.data.name), None)
 
             unselect_nonintersecting(bm, int_dict.keys(), edge_indices)
+            if edge_index is not None:
+                update_edge_index(edge_index, edge_keys, int_dict)
             update_mesh(bm, int_dict)
 
-            bmesh.update_edit_mesh(obj.data)
+            update_edit_mesh(obj.data)
         else:
             pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            show_message(context)
             return
 
         return
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        show_message(context)
         return
 
 class PDT_OT_IntersectAllEdges(bpy.types.Operator):
@@ -0,0 +1,58 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Run PDT Tests with Blender's Python from the clone:
+#
+#   blender -b --python-expr "import pytest; pytest.main(['tests'])"
+#
+# Test modules that need Blender skip themselves when bpy is not available,
+# test_geometry runs in plain CPython.
+#
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def pdt():
+    """Import the PDT Package from this Clone.
+
+    Returns:
+        The PDT Package, its modules are attributes, e.g. pdt.pdt_functions.
+    """
+
+    sys.path.insert(0, str(ROOT.parent))
+    package = importlib.import_module(ROOT.name)
+    for name in (
+        "pdt_api",
+        "pdt_command",
+        "pdt_exception",
+        "pdt_functions",
+        "pdt_pivot_point",
+    ):
+        importlib.import_module(f"{ROOT.name}.{name}")
+    return package
@@ -0,0 +1,45 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("bpy")
+
+
+def test_run_script_stops_at_line_raising_pdt_error(pdt, monkeypatch):
+    command = pdt.pdt_command
+    ran = []
+
+    def invalid_vector(context, pg, parsed):
+        ran.append(parsed)
+        raise pdt.pdt_exception.InvalidVector
+
+    monkeypatch.setitem(command.COMMAND_HANDLERS, ("C", "a"), invalid_vector)
+    context = MagicMock()
+    context.view_layer.objects.active = None
+    context.preferences.addons[command.__package__].preferences.pdt_input_round = 4
+
+    assert command.run_script(context, ["# Cursor", "", "ca1,2,3", "ca4,5,6"]) == 3
+    assert len(ran) == 1
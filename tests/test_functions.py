@@ -0,0 +1,79 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+import pytest
+
+bmesh = pytest.importorskip("bmesh")
+
+
+def test_weld_vertices_merges_onto_face_vertex_without_edge(pdt):
+    bm = bmesh.new()
+    quad = [bm.verts.new(co) for co in ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0))]
+    bm.faces.new(quad)
+    # Coincident pair away from the edit, must be left alone
+    bm.verts.new((9, 0, 0))
+    bm.verts.new((9, 0, 0))
+
+    # Joined to the first corner, lands on the opposite corner
+    new_vert = bm.verts.new((1, 1, 0))
+    bm.edges.new((quad[0], new_vert))
+    pdt.pdt_functions.weld_vertices(bm, [new_vert])
+
+    assert len(bm.verts) == 6
+    assert quad[2].is_valid != new_vert.is_valid
+    bm.free()
+
+
+def test_weld_vertices_without_neighbours_only_merges_given_vertices(pdt):
+    bm = bmesh.new()
+    vert_a = bm.verts.new((0, 0, 0))
+    vert_b = bm.verts.new((1, 0, 0))
+    bm.edges.new((vert_a, vert_b))
+    moved = [bm.verts.new((0, 0, 0)), bm.verts.new((0, 0, 0))]
+    bm.edges.new((moved[0], vert_a))
+
+    pdt.pdt_functions.weld_vertices(bm, moved, neighbours=False)
+
+    assert len(bm.verts) == 3
+    assert vert_a.is_valid
+    bm.free()
+
+
+def test_new_vertices_from_array_after_deleting_vertices(pdt):
+    bm = bmesh.new()
+    old_verts = [bm.verts.new((index, 0, 0)) for index in range(6)]
+    start_vertex = old_verts[0]
+    # Free places in the Bmesh, from_mesh may fill these
+    bmesh.ops.delete(bm, geom=old_verts[1:4], context="VERTS")
+
+    coords = [(0, index, 1) for index in range(1, 5)]
+    new_verts = pdt.pdt_functions.new_vertices_from_array(
+        bm, coords, connect=True, start_vertex=start_vertex
+    )
+
+    assert [tuple(v.co) for v in new_verts] == [tuple(map(float, co)) for co in coords]
+    assert new_verts[0] in {e.other_vert(start_vertex) for e in start_vertex.link_edges}
+    assert len(bm.verts) == 7
+    assert len(bm.edges) == 4
+    assert not bm.verts.layers.int
+    bm.free()
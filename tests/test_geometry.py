@@ -0,0 +1,173 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+#
+# The Geometry Core runs in plain CPython, these Tests do not need Blender.
+#
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import pdt_geometry as geometry  # noqa: E402
+from pdt_mathutils import Vector, intersect_line_line, intersect_point_line  # noqa: E402
+
+TOLERANCE = 1.0e-5
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(2019)
+
+
+def random_edges(rng, count, dims=3):
+    """Short Edges in clusters plus a few long ones crossing many cells."""
+    starts = rng.uniform(-10, 10, (count, dims))
+    ends = starts + rng.normal(0, 1, (count, dims))
+    ends[: count // 20] = rng.uniform(-10, 10, (count // 20, dims))
+    return np.stack((starts, ends), axis=1)
+
+
+def flat_edges(rng, count):
+    edges = np.zeros((count, 2, 3))
+    edges[:, :, :2] = random_edges(rng, count, dims=2)
+    return edges
+
+
+def scalar_intersection(edge_a, edge_b):
+    """Intersect All's per pair path, through the mathutils stand-in."""
+    line = intersect_line_line(*map(Vector, edge_a), *map(Vector, edge_b))
+    if line is None or (line[0] - line[1]).length > TOLERANCE:
+        return None
+    if geometry.point_on_edge(line[0], edge_a) and geometry.point_on_edge(line[0], edge_b):
+        return line[0]
+    return None
+
+
+def test_broad_phase_pairs_match_brute_force(rng):
+    edges = random_edges(rng, 300)
+    mins = edges.min(axis=1) - TOLERANCE
+    maxs = edges.max(axis=1) + TOLERANCE
+    expected = {
+        (a, b)
+        for a in range(len(edges))
+        for b in range(a + 1, len(edges))
+        if np.all(mins[a] <= maxs[b]) and np.all(mins[b] <= maxs[a])
+    }
+
+    pairs = geometry.broad_phase_pairs(edges, TOLERANCE)
+
+    assert {tuple(pair) for pair in pairs.tolist()} == expected
+    assert pairs.tolist() == sorted(pairs.tolist())
+
+
+def test_broad_phase_pairs_fewer_than_two_edges(rng):
+    assert geometry.broad_phase_pairs(random_edges(rng, 1)).shape == (0, 2)
+
+
+def test_intersect_edges_batch_matches_scalar_path(rng):
+    edges = flat_edges(rng, 120)
+    rows_a, rows_b = np.triu_indices(len(edges), k=1)
+
+    points, param_a, param_b, valid = geometry.intersect_edges_batch(
+        edges[rows_a], edges[rows_b], TOLERANCE
+    )
+
+    assert valid.any()
+    for row, (a, b) in enumerate(zip(rows_a, rows_b)):
+        expected = scalar_intersection(edges[a], edges[b])
+        assert valid[row] == (expected is not None)
+        if expected is not None:
+            assert np.allclose(points[row], np.array(expected), atol=1.0e-9)
+            assert 0.0 <= param_a[row] <= 1.0 and 0.0 <= param_b[row] <= 1.0
+
+
+def test_intersect_edges_batch_skew_and_parallel_edges():
+    edges_a = np.array([[[0, 0, 0], [2, 0, 0]], [[0, 0, 0], [2, 0, 0]]], dtype=float)
+    edges_b = np.array([[[1, -1, 1], [1, 1, 1]], [[0, 1, 0], [2, 1, 0]]], dtype=float)
+
+    valid = geometry.intersect_edges_batch(edges_a, edges_b, TOLERANCE)[3]
+
+    assert not valid.any()
+    assert scalar_intersection(edges_a[0], edges_b[0]) is None
+    assert scalar_intersection(edges_a[1], edges_b[1]) is None
+
+
+def test_sweep_line_pairs_find_every_crossing(rng):
+    segments = random_edges(rng, 200, dims=2)
+    rows_a, rows_b = np.triu_indices(len(segments), k=1)
+    valid = geometry.intersect_segments_2d(segments[rows_a], segments[rows_b], TOLERANCE)[2]
+    expected = {(a, b) for a, b, ok in zip(rows_a.tolist(), rows_b.tolist(), valid) if ok}
+
+    pairs = geometry.sweep_line_pairs(segments, TOLERANCE)
+    pairs = {tuple(pair) for pair in pairs.tolist()}
+
+    assert expected
+    assert expected <= pairs
+    # Candidates confirmed by the batch test are exactly the crossings
+    candidates = np.array(sorted(pairs))
+    confirmed = geometry.intersect_segments_2d(
+        segments[candidates[:, 0]], segments[candidates[:, 1]], TOLERANCE
+    )[2]
+    assert {tuple(pair) for pair in candidates[confirmed].tolist()} == expected
+
+
+def test_sweep_line_pairs_shared_end_and_vertical_segments():
+    segments = np.array(
+        [[[0, 0], [2, 2]], [[2, 2], [4, 0]], [[1, -1], [1, 3]], [[5, 5], [6, 6]]],
+        dtype=float,
+    )
+
+    pairs = {tuple(pair) for pair in geometry.sweep_line_pairs(segments).tolist()}
+
+    assert {(0, 1), (0, 2)} <= pairs
+    assert not any(3 in pair for pair in pairs)
+
+
+def test_point_params_on_edges_match_scalar_path(rng):
+    edges = random_edges(rng, 200)
+    factors = rng.uniform(-0.5, 1.5, len(edges))
+    points = edges[:, 0] + factors[:, None] * (edges[:, 1] - edges[:, 0])
+    # Move every other Point off its Edge
+    points[::2] += rng.normal(0, 1, (len(points[::2]), 3))
+
+    params, on_edge = geometry.point_params_on_edges(points, edges, TOLERANCE)
+
+    for point, edge, param, on in zip(points, edges, params, on_edge):
+        _closest, expected_param = intersect_point_line(Vector(point), *map(Vector, edge))
+        assert param == pytest.approx(expected_param, abs=1.0e-9)
+        assert on == geometry.point_on_edge(point, edge, TOLERANCE)
+    assert on_edge[1::2].sum() == np.count_nonzero((factors[1::2] >= 0) & (factors[1::2] <= 1))
+
+
+def test_vector_stand_in_products_match_mathutils():
+    vector_a = Vector((1, 2, 3))
+    vector_b = Vector((2, 2, 2))
+
+    assert tuple(vector_a * vector_b) == (2.0, 4.0, 6.0)
+    assert vector_a @ vector_b == 12.0
+    assert tuple(2 * vector_a) == (2.0, 4.0, 6.0)
+    with pytest.raises(TypeError):
+        hash(vector_a)
@@ -0,0 +1,122 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+#
+# The Maths Evaluator runs in plain CPython, these Tests do not need Blender.
+#
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pdt_maths import (  # noqa: E402
+    ExpressionError,
+    compile_expression,
+    evaluate,
+    evaluate_array,
+)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "pi.real",
+        "(1).__class__",
+        "__import__('os')",
+        "eval('1')",
+        "open('x')",
+        "exp.__globals__",
+        "lambda: 1",
+        "[i for i in (1, 2)]",
+        "sum(i for i in (1, 2))",
+        "{1: 2}",
+        "'text'",
+        "True",
+        "1 if 1 else 2",
+        "x",
+        "sin(x=1)",
+        "1 +",
+    ],
+)
+def test_evaluate_rejects_disallowed_expressions(expression):
+    with pytest.raises(ExpressionError):
+        evaluate(expression)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["-" * 100000 + "1", "(" * 5000 + "1" + ")" * 5000, "+".join(["1"] * 200000)],
+)
+def test_deep_nesting_raises_expression_error(expression):
+    with pytest.raises(ExpressionError):
+        evaluate(expression)
+
+
+@pytest.mark.parametrize("expression", ["1/0", "sqrt(-1)", "log(0)", "acos(2)", "10.0**400"])
+def test_domain_errors_raise_expression_error(expression):
+    with pytest.raises(ExpressionError):
+        evaluate(expression)
+
+
+def test_array_domain_errors_raise_expression_error():
+    with pytest.raises(ExpressionError):
+        evaluate_array("sqrt(i)", i=np.arange(-1, 2))
+    with pytest.raises(ExpressionError):
+        evaluate_array("1 / i", i=np.arange(3))
+
+
+def test_evaluate_matches_math():
+    assert evaluate("degrees(atan(3/4))") == pytest.approx(math.degrees(math.atan(0.75)))
+    assert evaluate("2 ** 3 // 3 % 2 - -1") == 1.0
+    assert evaluate("x * tau + y", x=2, y=1) == pytest.approx(2 * math.tau + 1)
+
+
+def test_compiled_expressions_are_cached():
+    expression = "sin(i / 10) * 2"
+    compile_expression(expression, ("i",))
+    hits = compile_expression.cache_info().hits
+
+    evaluate(expression, i=3)
+    evaluate(expression, i=4)
+
+    assert compile_expression.cache_info().hits == hits + 2
+
+
+@pytest.mark.parametrize("name", ["min", "max", "hypot"])
+def test_variadic_array_functions_match_scalar(name):
+    values = np.linspace(-3, 3, 7)
+    expression = f"{name}(i, 1, -2, i / 2)"
+
+    result = evaluate_array(expression, i=values)
+
+    assert result.shape == values.shape
+    expected = [evaluate(expression, i=value) for value in values]
+    assert np.allclose(result, expected)
+
+
+def test_evaluate_array_broadcasts_constants():
+    result = evaluate_array("2", i=np.arange(4))
+    assert result.tolist() == [2.0] * 4
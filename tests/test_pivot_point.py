@@ -0,0 +1,50 @@
+# ***** BEGIN GPL LICENSE BLOCK *****
+#
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ***** END GPL LICENCE BLOCK *****
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+from math import radians
+
+import pytest
+
+pytest.importorskip("bpy")
+from mathutils import Matrix, Vector  # noqa: E402
+
+
+def test_pivot_scale_matrix_in_view_axes_keeps_pivot_on_rotated_object(pdt):
+    matrix_world = (
+        Matrix.Translation((3, -2, 1))
+        @ Matrix.Rotation(radians(90), 4, "Z")
+        @ Matrix.Rotation(radians(30), 4, "X")
+    )
+    pivot = Vector((4, 1, -1))
+    # Top View, the View's Axes are the Global Axes
+    matrix = pdt.pdt_pivot_point.pivot_scale_matrix(
+        matrix_world, pivot, (2, 1, 1), Matrix.Identity(3)
+    )
+
+    local_pivot = matrix_world.inverted() @ pivot
+    assert (matrix_world @ (matrix @ local_pivot) - pivot).length < 1e-6
+
+    # A Point 1 along Global X from the Pivot ends up 2 along Global X
+    local_point = matrix_world.inverted() @ (pivot + Vector((1, 0, 0)))
+    moved = matrix_world @ (matrix @ local_point)
+    assert (moved - (pivot + Vector((2, 0, 0)))).length < 1e-6